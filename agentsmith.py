@@ -143,7 +143,7 @@ def main():
     analyze_parser.add_argument('--max-file-bytes', type=int, default=500_000, help='Max file size')
     analyze_parser.add_argument('--max-files', type=int, default=400, help='Max files to analyze')
     analyze_parser.add_argument('--prioritize-top', type=int, default=15, help='Top N files to prioritize')
-    analyze_parser.add_argument('--format', nargs='*', default=['console'], choices=['console', 'html', 'markdown', 'json'])
+    analyze_parser.add_argument('--format', nargs='*', default=['console'], choices=['console', 'html', 'markdown', 'json', 'ndjson'])
     analyze_parser.add_argument('--model', default=_default_model, help=model_cli_help())
     analyze_parser.add_argument('--max-tokens', type=int, default=4000, help='Max tokens per response')
     analyze_parser.add_argument('--temperature', type=float, default=0.0, help='Sampling temperature')
@@ -197,7 +197,7 @@ def main():
     ctf_parser.add_argument('--max-file-bytes', type=int, default=500_000, help='Max file size')
     ctf_parser.add_argument('--max-files', type=int, default=400, help='Max files to analyze')
     ctf_parser.add_argument('--prioritize-top', type=int, default=15, help='Top N files to prioritize')
-    ctf_parser.add_argument('--format', nargs='*', default=['console'], choices=['console', 'html', 'markdown', 'json'])
+    ctf_parser.add_argument('--format', nargs='*', default=['console'], choices=['console', 'html', 'markdown', 'json', 'ndjson'])
     ctf_parser.add_argument('--top-n', type=int, default=10, help='Top N findings for payloads')
     ctf_parser.add_argument('--generate-payloads', action='store_true', help='Generate exploitation payloads')
     ctf_parser.add_argument('--annotate-code', action='store_true', help='Generate code annotations')
@@ -393,6 +393,7 @@ def main() -> None:
         include_yaml=args.include_yaml,
         include_helm=args.include_helm,
         skip_dirs=skip_dirs,
+        follow_symlinks=False,
     )
     
     # Filter by extensions if specified (post-scan filtering)
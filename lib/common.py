@@ -7,14 +7,30 @@ Reduces code duplication and provides consistent behavior.
 from __future__ import annotations
 
 import functools
+import itertools
 import json
 import logging
 import os
+import random
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable, TypeVar
+from typing import Optional, Callable, Iterator, TypeVar
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster JSON parsing, stdlib json used otherwise
+
+try:
+    import anthropic
+    _APIStatusError = anthropic.APIStatusError
+    _AnthropicAPIError = anthropic.APIError
+except ImportError:
+    # Empty tuples make the isinstance checks in handle_api_error cheaply False
+    _APIStatusError = _AnthropicAPIError = ()
 
 T = TypeVar('T')
 
@@ -27,6 +43,10 @@ HELM_EXTS = {".tpl", ".gotmpl"}
 # JSON parsing regex (matches code fences)
 _CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to catch the stdlib exception regardless of which parser is active.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 def get_api_key() -> str:
     """Retrieves the Claude API key from environment variable."""
@@ -58,7 +78,7 @@ def parse_json_response(response_text: str, max_size: int = 1_000_000) -> Option
         return None
     
     # Remove markdown code fences if present
-    cleaned = _CODE_FENCE_RE.sub("", response_text).strip()
+    cleaned = _strip_fences(response_text)
     
     # Find JSON object boundaries
     start = cleaned.find("{")
@@ -66,19 +86,130 @@ def parse_json_response(response_text: str, max_size: int = 1_000_000) -> Option
     
     if start != -1 and end != -1 and end > start:
         try:
-            return json.loads(cleaned[start : end + 1])
+            return _json_loads(cleaned[start : end + 1])
         except json.JSONDecodeError:
-            # Try with regex for nested objects
-            match = re.search(r'\{.*\}', cleaned, re.DOTALL)
-            if match:
+            # Fall back to the first balanced object (handles trailing prose/objects)
+            span = _find_json_span(cleaned, start)
+            if span is not None and span != (start, end + 1):
                 try:
-                    return json.loads(match.group(0))
+                    return _json_loads(cleaned[span[0] : span[1]])
                 except json.JSONDecodeError:
                     return None
             return None
     return None
 
 
+def _strip_fences(text: str) -> str:
+    """
+    Strip markdown code fences from a response.
+    
+    Fences almost always wrap the whole response, so a leading/trailing
+    slice handles the common case; the regex only runs if fences remain.
+    """
+    text = text.strip()
+    if "```" not in text:
+        return text
+    
+    if text.startswith("```"):
+        text = text[3:]
+        if text.startswith("json"):
+            text = text[4:]
+    if text.endswith("```"):
+        text = text[:-3]
+    text = text.strip()
+    
+    if "```" in text:
+        text = _CODE_FENCE_RE.sub("", text).strip()
+    return text
+
+
+def _find_json_span(text: str, start: int = 0) -> Optional[tuple[int, int]]:
+    """
+    Find the first balanced {...} span in text, ignoring braces inside strings.
+    
+    Single linear pass; returns (start, end) suitable for slicing, or None.
+    """
+    start = text.find("{", start)
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
+
+_STAT_WORKERS = 8
+_STAT_BATCH_SIZE = 256
+
+
+def _iter_candidate_files(
+    repo: Path,
+    allowed_exts: frozenset[str],
+    skip_patterns: frozenset[str],
+) -> Iterator[os.DirEntry]:
+    """
+    Yield directory entries for files with an allowed extension.
+    
+    Uses os.scandir so skipped directories are pruned before descending into
+    them, and DirEntry type checks avoid a stat() per entry. The walk is a
+    depth-first preorder in listing order (a directory's files, then each
+    subdirectory in full), matching Path.rglob() on Python 3.11, so a
+    max_files cap keeps the same subset.
+    """
+    pending = [os.fspath(repo)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        
+        subdirs = []
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip excluded directories
+                        if entry.name not in skip_patterns:
+                            subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                
+                # Check extension
+                if os.path.splitext(entry.name)[1].lower() in allowed_exts:
+                    yield entry
+        # Reversed so the first listed subdirectory is walked next
+        pending.extend(reversed(subdirs))
+
+
+def _entry_size(entry: os.DirEntry) -> Optional[int]:
+    """Return the size of a directory entry, or None if it cannot be stat'ed."""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return None
+
+
 def scan_repo_files(
     repo_path: str | Path,
     include_yaml: bool = False,
@@ -86,6 +217,7 @@ def scan_repo_files(
     max_file_bytes: int = 500_000,
     max_files: int = 400,
     skip_dirs: Optional[set[str]] = None,
+    follow_symlinks: bool = True,
 ) -> list[Path]:
     """
     Scans a repository for code files suitable for analysis.
@@ -97,51 +229,64 @@ def scan_repo_files(
         max_file_bytes: Maximum file size to analyze
         max_files: Maximum number of files to return
         skip_dirs: Additional directories to skip (merged with default SKIP_DIRS)
+        follow_symlinks: Resolve symlinked files to their targets; pass
+            False to skip the per-file resolve and keep in-repo link paths
     
     Returns:
-        Sorted list of file paths to analyze
+        Sorted list of absolute file paths to analyze
     """
     repo = Path(repo_path)
     if not repo.is_dir():
         raise ValueError(f"Repository path '{repo_path}' is not a directory")
+    # Resolve the root once; paths built beneath it are already canonical
+    repo = repo.resolve()
     
     allowed_exts = set(CODE_EXTS)
     if include_yaml:
         allowed_exts |= YAML_EXTS
     if include_helm:
         allowed_exts |= HELM_EXTS
-    
-    skip_patterns = SKIP_DIRS | (skip_dirs or set())
-    
-    results: list[Path] = []
-    for file_path in repo.rglob("*"):
-        if len(results) >= max_files:
-            break
-        
-        if not file_path.is_file():
-            continue
-        
-        # Skip excluded directories
-        if any(skip in file_path.parts for skip in skip_patterns):
-            continue
-        
-        # Check extension
-        if file_path.suffix.lower() not in allowed_exts:
-            continue
-        
-        # Check file size with proper error handling
-        try:
-            file_stat = file_path.stat()
-            if file_stat.st_size > max_file_bytes:
-                continue
-        except (OSError, PermissionError):
-            continue
-        
-        # Use resolved paths for canonical representation
-        results.append(file_path.resolve())
+    allowed_exts = frozenset(allowed_exts)
+    
+    skip_patterns = frozenset(SKIP_DIRS | (skip_dirs or set()))
+    
+    # (suffix, lowercased path, path) tuples, so sort keys come from the
+    # strings already in hand rather than from Path properties
+    results: list[tuple[str, str, Path]] = []
+    candidates = _iter_candidate_files(repo, allowed_exts, skip_patterns)
+    # stat() is latency-bound and releases the GIL, so size checks run in
+    # batches on a small thread pool to keep more than one request in flight.
+    with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as executor:
+        while len(results) < max_files:
+            batch = list(itertools.islice(candidates, _STAT_BATCH_SIZE))
+            if not batch:
+                break
+            for entry, size in zip(batch, executor.map(_entry_size, batch)):
+                # Check file size (None means stat failed)
+                if size is None or size > max_file_bytes:
+                    continue
+                file_path = Path(entry.path)
+                if follow_symlinks:
+                    file_path = file_path.resolve()
+                    key_name, key_path = file_path.name, str(file_path)
+                else:
+                    key_name, key_path = entry.name, entry.path
+                results.append((os.path.splitext(key_name)[1], key_path.lower(), file_path))
+                if len(results) >= max_files:
+                    break
     
     # Sort by extension and full path for consistent ordering
-    return sorted(results, key=lambda p: (p.suffix, str(p).lower()))
+    results.sort()
+    return [file_path for _, _, file_path in results]
+
+
+@functools.lru_cache(maxsize=4096)
+def cached_path(path: str) -> Path:
+    """
+    Path(path), cached for reports and flows that name the same files
+    over and over. Use .name / .as_posix() on the result.
+    """
+    return Path(path)
 
 
 def validate_repo_path(path: str | Path) -> Path:
@@ -179,6 +324,15 @@ def estimate_api_cost(input_tokens: int, output_tokens: int, model: str = "haiku
     return (input_tokens * input_price) + (output_tokens * output_price)
 
 
+def _sleep_until(deadline: float) -> None:
+    """Sleep until a time.monotonic() deadline, resuming after early wakeups."""
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(remaining)
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     base_delay: float = 1.0,
@@ -189,7 +343,7 @@ def retry_with_backoff(
     
     Handles API errors gracefully:
     - Client errors (4xx): No retry, raise immediately
-    - Server errors (5xx): Retry with exponential backoff
+    - Server errors (5xx): Retry with exponential backoff (with jitter)
     - Rate limits (429): Retry with longer delay
     
     Works with anthropic.APIStatusError and other exceptions that have status_code attribute.
@@ -203,6 +357,13 @@ def retry_with_backoff(
         Decorator function
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if max_retries == 1:
+            # A single attempt never sleeps or retries; skip the retry machinery
+            @functools.wraps(func)
+            def single_attempt(*args, **kwargs) -> T:
+                return func(*args, **kwargs)
+            return single_attempt
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
             last_exception: Optional[Exception] = None
@@ -220,10 +381,13 @@ def retry_with_backoff(
                     
                     # Retry on server errors (5xx) and rate limits (429)
                     if attempt < max_retries - 1:
-                        delay = min(base_delay * (2 ** attempt), max_delay)
+                        # Jitter spreads out retries from parallel workers
+                        delay = min(
+                            base_delay * (2 ** attempt) * random.uniform(0.5, 1.5), max_delay
+                        )
                         if status_code == 429:
                             delay = max(delay, 5.0)  # Longer delay for rate limits
-                        time.sleep(delay)
+                        _sleep_until(time.monotonic() + delay)
                     else:
                         # Last attempt failed, raise the exception
                         raise
@@ -240,10 +404,25 @@ def retry_with_backoff(
 # Finding Normalization Utilities
 # ============================================================================
 
+# Field fallback chains, highest priority first
+_RECOMMENDATION_KEYS = ('recommendation', 'fix', 'explanation', 'description')
+_DESCRIPTION_KEYS = ('description', 'explanation', 'recommendation')
+
+
+def _first_truthy(finding: dict, keys: tuple[str, ...], default: str = 'N/A'):
+    """Return the first truthy value among keys, or default."""
+    for key in keys:
+        value = finding.get(key)
+        if value:
+            return value
+    return default
+
+
 def normalize_finding(
     finding: dict,
     file_path: Optional[Path | str] = None,
-    source: Optional[str] = None
+    source: Optional[str] = None,
+    inplace: bool = False
 ) -> dict:
     """
     Normalize a finding dictionary to ensure consistent field names and values.
@@ -261,11 +440,13 @@ def normalize_finding(
         finding: Finding dictionary to normalize
         file_path: Optional file path to set/override
         source: Optional source identifier (e.g., 'claude-owasp', 'agentsmith')
+        inplace: Modify and return the given dict instead of a copy. Use only
+            when the caller owns the finding (e.g. freshly parsed API output).
     
     Returns:
-        Normalized finding dictionary (new dict, doesn't modify original)
+        Normalized finding dictionary (new dict unless inplace=True)
     """
-    normalized = finding.copy()
+    normalized = finding if inplace else finding.copy()
     
     # Normalize file path
     if file_path:
@@ -281,25 +462,13 @@ def normalize_finding(
         normalized['line'] = normalized['line_number']
     
     # Normalize recommendation field (priority: recommendation > fix > explanation > description)
-    if 'recommendation' not in normalized or not normalized.get('recommendation'):
-        normalized['recommendation'] = (
-            normalized.get('fix') or 
-            normalized.get('explanation') or 
-            normalized.get('description') or 
-            'N/A'
-        )
+    normalized['recommendation'] = _first_truthy(normalized, _RECOMMENDATION_KEYS)
     
     # Ensure description exists (priority: description > explanation > recommendation)
-    if 'description' not in normalized or not normalized.get('description'):
-        normalized['description'] = (
-            normalized.get('explanation') or 
-            normalized.get('recommendation') or 
-            'N/A'
-        )
+    normalized['description'] = _first_truthy(normalized, _DESCRIPTION_KEYS)
     
     # Ensure explanation exists (for backward compatibility)
-    if 'explanation' not in normalized or not normalized.get('explanation'):
-        normalized['explanation'] = normalized.get('description', 'N/A')
+    normalized['explanation'] = normalized.get('explanation') or normalized['description']
     
     # Set source if provided
     if source:
@@ -328,6 +497,33 @@ def normalize_finding(
     return normalized
 
 
+def dump_findings(findings: list[dict], path: Path | str) -> None:
+    """
+    Write findings to a JSON file (indented, UTF-8).
+    
+    Uses orjson when available; both backends write the same file. Non-JSON
+    values such as Path objects are written as strings, so findings need not
+    be normalized first.
+    
+    Args:
+        findings: List of finding dictionaries
+        path: Output file path
+    """
+    path = Path(path)
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                findings,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(findings, f, indent=2, default=str, ensure_ascii=False)
+            f.write("\n")
+
+
 def get_recommendation_text(finding: dict) -> str:
     """
     Extract recommendation text from a finding using fallback logic.
@@ -338,13 +534,7 @@ def get_recommendation_text(finding: dict) -> str:
     Returns:
         Recommendation text or 'N/A' if not found
     """
-    return (
-        finding.get('recommendation') or 
-        finding.get('fix') or 
-        finding.get('explanation') or 
-        finding.get('description') or 
-        'N/A'
-    )
+    return _first_truthy(finding, _RECOMMENDATION_KEYS)
 
 
 def get_line_number(finding: dict) -> int | str:
@@ -412,10 +602,8 @@ def handle_api_error(
     Raises:
         APIError: For non-retryable errors or after max retries
     """
-    import anthropic
-    
     # Handle Anthropic API errors
-    if isinstance(error, anthropic.APIStatusError):
+    if isinstance(error, _APIStatusError):
         status_code = error.status_code
         
         # Rate limit (429) or overloaded (529) - retry with backoff
@@ -451,7 +639,7 @@ def handle_api_error(
                 )
     
     # Handle other API errors
-    elif isinstance(error, anthropic.APIError):
+    elif isinstance(error, _AnthropicAPIError):
         # Network errors, timeouts, etc. - retry
         if attempt < max_retries - 1:
             wait_time = min(2.0 ** (attempt + 1), 30.0)
@@ -469,6 +657,9 @@ def handle_api_error(
     )
 
 
+_READ_CHUNK_CHARS = 65536
+
+
 def safe_file_read(file_path: Path, max_size: int = 10_000_000) -> str:
     """
     Safely read a file with size and error checking.
@@ -491,7 +682,18 @@ def safe_file_read(file_path: Path, max_size: int = 10_000_000) -> str:
                 f"File too large: {file_stat.st_size} bytes (max {max_size})"
             )
         
-        return file_path.read_text(encoding="utf-8", errors="replace")
+        # Read in bounded chunks so a file growing after stat() can't exceed
+        # max_size, and join once instead of growing a string buffer.
+        chunks: list[str] = []
+        remaining = max_size
+        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            while remaining > 0:
+                chunk = f.read(min(_READ_CHUNK_CHARS, remaining))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        return "".join(chunks)
     
     except (OSError, IOError, PermissionError) as e:
         raise FileAnalysisError(file_path, f"File read error: {str(e)}", original_error=e)
@@ -9,6 +9,10 @@ Estimates API costs before running a scan based on:
 - Features enabled (prioritization, payloads, annotations)
 """
 
+import functools
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional
 from pathlib import Path
 from lib.cost_tracker import MODEL_PRICING, DEFAULT_PRICING
@@ -39,22 +43,71 @@ AVG_OUTPUT_TOKENS = {
 def estimate_file_tokens(file_path: Path) -> int:
     """Estimate input tokens for a file based on its size."""
     try:
-        # Read first few lines to get average line length
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-            if not lines:
-                return 0
-            
-            # Estimate: ~1.5 tokens per line on average
-            # Account for prompt overhead per file
-            estimated_tokens = len(lines) * TOKENS_PER_LINE
-            return int(estimated_tokens)
-    except Exception:
+        st = os.stat(file_path)
+    except OSError:
+        return 1000  # Default estimate
+    
+    # Keyed on mtime/size so edits between calls are picked up
+    return _cached_file_tokens(str(file_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_file_tokens(file_path: str, mtime_ns: int, size: int) -> int:
+    """Count lines at the byte level and convert to an estimated token count."""
+    try:
+        lines = _count_lines(file_path, size)
+    except (OSError, ValueError):
         # Fallback: use file size in bytes / 4 (rough approximation)
-        try:
-            return int(file_path.stat().st_size / 4)
-        except Exception:
-            return 1000  # Default estimate
+        return int(size / 4)
+    
+    # Estimate: ~1.5 tokens per line on average
+    return int(lines * TOKENS_PER_LINE)
+
+
+# Files at least this large are memory-mapped and counted in chunks
+_MMAP_THRESHOLD = 1 << 20
+_COUNT_CHUNK = 1 << 20
+
+
+def _line_ends(data: bytes) -> int:
+    """Count line endings; \\n, \\r and \\r\\n each end a line, as in readlines()."""
+    return data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+
+
+def _count_lines(file_path: str, size: int) -> int:
+    """Count lines (a trailing partial line counts) without decoding the file."""
+    with open(file_path, "rb") as f:
+        if size < _MMAP_THRESHOLD:
+            data = f.read()
+            if not data:
+                return 0
+            return _line_ends(data) + (data[-1:] not in (b"\n", b"\r"))
+        
+        # Large files: bytes.count is already a C scan, mmap just avoids
+        # holding a full copy of the file in memory at once.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ends = 0
+            prev_cr = False
+            for i in range(0, len(mm), _COUNT_CHUNK):
+                chunk = mm[i : i + _COUNT_CHUNK]
+                ends += _line_ends(chunk)
+                # A \r\n split across two chunks was counted as two endings
+                if prev_cr and chunk.startswith(b"\n"):
+                    ends -= 1
+                prev_cr = chunk.endswith(b"\r")
+            return ends + (mm[-1:] not in (b"\n", b"\r"))
+
+
+# Below this many files a process pool costs more to start than it saves
+_PARALLEL_MIN_FILES = 64
+
+
+def _estimate_tokens_by_file(files: List[Path], parallel: bool) -> Dict[Path, int]:
+    """Map each file to its estimated tokens, optionally across processes."""
+    if parallel and len(files) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return dict(zip(files, executor.map(estimate_file_tokens, files, chunksize=16)))
+    return {file_path: estimate_file_tokens(file_path) for file_path in files}
 
 
 def estimate_scan_cost(
@@ -66,11 +119,15 @@ def estimate_scan_cost(
     generate_payloads: bool = False,
     annotate_code: bool = False,
     top_n: int = 5,
-    threat_model: bool = False
+    threat_model: bool = False,
+    parallel: bool = False
 ) -> Dict[str, any]:
     """
     Estimate total cost for a scan.
     
+    With parallel=True, per-file token estimates for large file sets are
+    computed in a process pool.
+    
     Returns a dictionary with:
     - total_estimated_cost: float
     - breakdown_by_stage: Dict[str, Dict]
@@ -79,6 +136,9 @@ def estimate_scan_cost(
     """
     pricing = MODEL_PRICING.get(model, DEFAULT_PRICING)
     input_price, output_price = pricing
+    # Prices are per 1M tokens; convert once to per-token rates
+    input_per_token = input_price / 1_000_000
+    output_per_token = output_price / 1_000_000
     
     total_input_tokens = 0
     total_output_tokens = 0
@@ -97,7 +157,7 @@ def estimate_scan_cost(
         total_output_tokens += prioritization_output
         total_calls += 1
         
-        cost = (prioritization_input / 1_000_000) * input_price + (prioritization_output / 1_000_000) * output_price
+        cost = prioritization_input * input_per_token + prioritization_output * output_per_token
         breakdown["prioritization"] = {
             "calls": 1,
             "input_tokens": prioritization_input,
@@ -111,47 +171,39 @@ def estimate_scan_cost(
     else:
         analysis_files = files
     
+    # Estimate each file once; analysis and threat modeling share the results
+    needed_files = set(analysis_files) if profiles else set()
+    if threat_model:
+        needed_files.update(files)
+    tokens_by_file = _estimate_tokens_by_file(list(needed_files), parallel)
+    
     # 2. Analysis (per profile, per file)
-    analysis_input_total = 0
-    analysis_output_total = 0
-    analysis_calls = 0
+    # Every profile sees the same files, so the per-profile totals are shared
+    file_tokens = sum(tokens_by_file[file_path] for file_path in analysis_files) if profiles else 0
+    profile_calls = len(analysis_files)
+    profile_input = PROMPT_OVERHEAD["analysis"] * profile_calls + file_tokens
+    profile_output = AVG_OUTPUT_TOKENS["analysis"] * profile_calls
+    profile_cost = profile_input * input_per_token + profile_output * output_per_token
     
     for profile in profiles:
-        profile_input = 0
-        profile_output = 0
-        profile_calls = 0
-        
-        for file_path in analysis_files:
-            # Estimate tokens per file
-            file_tokens = estimate_file_tokens(file_path)
-            
-            # Add prompt overhead per file
-            per_file_input = PROMPT_OVERHEAD["analysis"] + file_tokens
-            per_file_output = AVG_OUTPUT_TOKENS["analysis"]
-            
-            profile_input += per_file_input
-            profile_output += per_file_output
-            profile_calls += 1
-        
-        analysis_input_total += profile_input
-        analysis_output_total += profile_output
-        analysis_calls += profile_calls
-        
-        cost = (profile_input / 1_000_000) * input_price + (profile_output / 1_000_000) * output_price
         breakdown[f"analysis_{profile}"] = {
             "calls": profile_calls,
             "input_tokens": profile_input,
             "output_tokens": profile_output,
             "total_tokens": profile_input + profile_output,
-            "cost": cost
+            "cost": profile_cost
         }
     
+    analysis_input_total = profile_input * len(profiles)
+    analysis_output_total = profile_output * len(profiles)
+    analysis_calls = profile_calls * len(profiles)
+    
     total_input_tokens += analysis_input_total
     total_output_tokens += analysis_output_total
     total_calls += analysis_calls
     
     # Combine all analysis into one entry for summary
-    analysis_cost = (analysis_input_total / 1_000_000) * input_price + (analysis_output_total / 1_000_000) * output_price
+    analysis_cost = analysis_input_total * input_per_token + analysis_output_total * output_per_token
     breakdown["analysis"] = {
         "calls": analysis_calls,
         "input_tokens": analysis_input_total,
@@ -173,7 +225,7 @@ def estimate_scan_cost(
         total_output_tokens += payload_output
         total_calls += payload_calls
         
-        cost = (payload_input / 1_000_000) * input_price + (payload_output / 1_000_000) * output_price
+        cost = payload_input * input_per_token + payload_output * output_per_token
         breakdown["payload_generation"] = {
             "calls": payload_calls,
             "input_tokens": payload_input,
@@ -193,7 +245,7 @@ def estimate_scan_cost(
         total_output_tokens += annotation_output
         total_calls += annotation_calls
         
-        cost = (annotation_input / 1_000_000) * input_price + (annotation_output / 1_000_000) * output_price
+        cost = annotation_input * input_per_token + annotation_output * output_per_token
         breakdown["annotation"] = {
             "calls": annotation_calls,
             "input_tokens": annotation_input,
@@ -207,8 +259,7 @@ def estimate_scan_cost(
         # Threat modeling analyzes all files together
         threat_input = PROMPT_OVERHEAD["threat_modeling"]
         # Add all file tokens
-        for file_path in files:
-            threat_input += estimate_file_tokens(file_path)
+        threat_input += sum(tokens_by_file[file_path] for file_path in files)
         
         threat_output = AVG_OUTPUT_TOKENS["threat_modeling"]
         
@@ -216,7 +267,7 @@ def estimate_scan_cost(
         total_output_tokens += threat_output
         total_calls += 1
         
-        cost = (threat_input / 1_000_000) * input_price + (threat_output / 1_000_000) * output_price
+        cost = threat_input * input_per_token + threat_output * output_per_token
         breakdown["threat_modeling"] = {
             "calls": 1,
             "input_tokens": threat_input,
@@ -226,7 +277,7 @@ def estimate_scan_cost(
         }
     
     # Calculate total cost
-    total_cost = (total_input_tokens / 1_000_000) * input_price + (total_output_tokens / 1_000_000) * output_price
+    total_cost = total_input_tokens * input_per_token + total_output_tokens * output_per_token
     
     return {
         "total_estimated_cost": total_cost,
@@ -6,9 +6,33 @@ Provides intelligent deduplication of findings from multiple profiles
 that may identify the same vulnerability with slightly different descriptions.
 """
 
-from typing import List, Dict, Any, Tuple, Set
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Dict, Any, FrozenSet, Optional, Tuple, Set
 from pathlib import Path
-import difflib
+import re
+
+from lib.common import cached_path
+
+if TYPE_CHECKING:
+    from difflib import SequenceMatcher
+
+try:
+    from rapidfuzz import fuzz as _rapidfuzz
+except ImportError:
+    _rapidfuzz = None  # Optional: C++ string similarity, difflib used otherwise
+
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None  # Optional: Aho-Corasick keyword matching, regex used otherwise
+
+try:
+    # Batch scoring needs numpy (a rapidfuzz extra) for the score matrix
+    import numpy as _np
+    from rapidfuzz import process as _rapidfuzz_process
+except ImportError:
+    _np = _rapidfuzz_process = None
 
 
 def are_findings_similar(
@@ -27,29 +51,70 @@ def are_findings_similar(
     Returns:
         True if findings are similar enough to be considered duplicates
     """
+    return _normalized_similar(_normalize(finding1), _normalize(finding2), similarity_threshold)
+
+
+# Severity ordering for merge strategies
+_SEVERITY_ORDER = {"CRITICAL": 4, "HIGH": 3, "MEDIUM": 2, "LOW": 1, "INFO": 0}
+
+
+@dataclass(slots=True)
+class _NormFinding:
+    """Fields of a finding used for deduplication, normalized once."""
+    file: str                   # POSIX-style path
+    line: Any                   # int, or the raw value as a string if unparseable
+    title: str                  # Lowercased, stripped title (or rule_name)
+    category: str               # Lowercased, stripped category
+    severity_rank: int          # Position in _SEVERITY_ORDER (0 if unknown)
+    terms: FrozenSet[str]       # Security terms found in the title
+
+
+def _normalize(finding: Dict[str, Any]) -> _NormFinding:
+    """Extract and normalize the fields used for similarity checks."""
+    file_path = cached_path(finding.get('file', '')).as_posix()
+    
+    line = finding.get('line_number', finding.get('line', 0))
+    try:
+        line = int(line) if line else 0
+    except (ValueError, TypeError):
+        line = str(line)
+    
+    title = str(finding.get('title', finding.get('rule_name', ''))).lower().strip()
+    category = str(finding.get('category', '')).lower().strip()
+    severity_rank = _SEVERITY_ORDER.get(str(finding.get('severity', 'LOW')).upper(), 0)
+    terms = frozenset(_extract_security_terms(title)) if title else frozenset()
+    return _NormFinding(file_path, line, title, category, severity_rank, terms)
+
+
+def _normalized_similar(
+    norm1: _NormFinding,
+    norm2: _NormFinding,
+    similarity_threshold: float,
+    title_similarity: Optional[float] = None,
+    matchers: Optional[Dict[str, "SequenceMatcher"]] = None
+) -> bool:
+    """
+    Similarity check on findings produced by _normalize().
+    
+    title_similarity may be supplied when it was already computed in batch.
+    matchers is passed through to _text_similarity.
+    """
+    file1, line1, title1, cat1 = norm1.file, norm1.line, norm1.title, norm1.category
+    file2, line2, title2, cat2 = norm2.file, norm2.line, norm2.title, norm2.category
+    
     # Must be in the same file
-    file1 = Path(finding1.get('file', '')).as_posix()
-    file2 = Path(finding2.get('file', '')).as_posix()
     if file1 != file2:
         return False
     
     # Must be on the same line (or very close - within 5 lines)
-    line1 = finding1.get('line_number', finding1.get('line', 0))
-    line2 = finding2.get('line_number', finding2.get('line', 0))
-    try:
-        line1 = int(line1) if line1 else 0
-        line2 = int(line2) if line2 else 0
+    if isinstance(line1, int) and isinstance(line2, int):
         if abs(line1 - line2) > 5:
             return False
-    except (ValueError, TypeError):
+    elif str(line1) != str(line2):
         # If we can't parse line numbers, require exact match
-        if str(line1) != str(line2):
-            return False
+        return False
     
     # Check title similarity
-    title1 = str(finding1.get('title', finding1.get('rule_name', ''))).lower().strip()
-    title2 = str(finding2.get('title', finding2.get('rule_name', ''))).lower().strip()
-    
     if not title1 or not title2:
         return False
     
@@ -58,53 +123,193 @@ def are_findings_similar(
         return True
     
     # Check similarity using sequence matcher
-    title_similarity = difflib.SequenceMatcher(None, title1, title2).ratio()
+    if title_similarity is None:
+        title_similarity = _text_similarity(title1, title2, similarity_threshold, matchers)
     if title_similarity >= similarity_threshold:
         return True
     
     # Check if titles contain similar keywords (for cases like "SQL Injection" vs "SQLi")
-    # Extract key security terms
-    security_terms1 = _extract_security_terms(title1)
-    security_terms2 = _extract_security_terms(title2)
+    security_terms1 = norm1.terms
+    security_terms2 = norm2.terms
     
     if security_terms1 and security_terms2:
         # If they share significant security terms, check category
         common_terms = security_terms1.intersection(security_terms2)
         if len(common_terms) >= 2:  # At least 2 common security terms
             # Also check category similarity
-            cat1 = str(finding1.get('category', '')).lower().strip()
-            cat2 = str(finding2.get('category', '')).lower().strip()
             if cat1 and cat2:
-                cat_similarity = difflib.SequenceMatcher(None, cat1, cat2).ratio()
+                cat_similarity = _text_similarity(cat1, cat2, 0.6, matchers)
                 if cat_similarity >= 0.6:  # Categories are similar
                     return True
     
     return False
 
 
+def _text_similarity(
+    text1: str,
+    text2: str,
+    score_cutoff: float = 0.0,
+    matchers: Optional[Dict[str, "SequenceMatcher"]] = None
+) -> float:
+    """
+    Similarity ratio between two strings (0.0-1.0).
+    
+    Uses RapidFuzz's normalized Indel similarity when installed, which is
+    close to (and never below) difflib's ratio; otherwise difflib.
+    
+    Returns 0.0 early when the ratio provably falls below score_cutoff.
+    
+    matchers caches one SequenceMatcher per text2. SequenceMatcher indexes
+    its second sequence, so reusing it with set_seq1() skips re-indexing
+    strings that recur across many comparisons.
+    """
+    if _rapidfuzz is not None:
+        return _rapidfuzz.ratio(text1, text2, score_cutoff=score_cutoff * 100) / 100.0
+    
+    if matchers is None:
+        matcher = _new_sequence_matcher(text1, text2)
+    else:
+        matcher = matchers.get(text2)
+        if matcher is None:
+            matcher = matchers[text2] = _new_sequence_matcher(text1, text2)
+        else:
+            matcher.set_seq1(text1)
+    # real_quick_ratio() (length bound) and quick_ratio() (character multiset
+    # bound) are both upper bounds on ratio(), and far cheaper to compute
+    if score_cutoff and (
+        matcher.real_quick_ratio() < score_cutoff or matcher.quick_ratio() < score_cutoff
+    ):
+        return 0.0
+    return matcher.ratio()
+
+
+# difflib is only needed without RapidFuzz, so it is imported on first use
+_SequenceMatcher = None
+
+
+def _new_sequence_matcher(text1: str, text2: str) -> "SequenceMatcher":
+    """Create a difflib SequenceMatcher, importing difflib on first call."""
+    global _SequenceMatcher
+    if _SequenceMatcher is None:
+        from difflib import SequenceMatcher as _SequenceMatcher
+    return _SequenceMatcher(None, text1, text2)
+
+
+# Findings can only match within +/-5 lines, so bucketing lines into bands of
+# 6 means any match lies in the same band or one of its two neighbours.
+_LINE_BAND = 6
+
+
+def _bucket_key(norm: _NormFinding) -> tuple:
+    """Bucket key for a normalized finding: (file, line band) or (file, raw line)."""
+    file_path, line = norm.file, norm.line
+    if isinstance(line, int):
+        return (file_path, line // _LINE_BAND)
+    return (file_path, line)
+
+
+def _neighbor_keys(norm: _NormFinding) -> Tuple[tuple, ...]:
+    """Bucket keys that could hold findings similar to this one."""
+    key = _bucket_key(norm)
+    if isinstance(norm.line, int):
+        file_path, band = key
+        return ((file_path, band - 1), key, (file_path, band + 1))
+    return (key,)
+
+
+def _batch_title_scores(
+    norms: List[_NormFinding],
+    buckets: Dict[tuple, List[int]],
+    similarity_threshold: float
+) -> Optional[Dict[Tuple[int, int], float]]:
+    """
+    Score titles of all candidate pairs with one cdist call per bucket.
+    
+    Each bucket is scored against itself plus the next line band, which
+    covers every pair within the +/-5 line window exactly once. Returns
+    {(i, j): score} for i < j and scores at or above the threshold, or
+    None when batch scoring is unavailable.
+    """
+    if _rapidfuzz_process is None or _rapidfuzz is None:
+        return None
+    
+    cutoff = similarity_threshold * 100
+    scores: Dict[Tuple[int, int], float] = {}
+    for key, rows in buckets.items():
+        cols = list(rows)
+        if isinstance(key[1], int):
+            cols.extend(buckets.get((key[0], key[1] + 1), ()))
+        if len(cols) < 2:
+            continue
+        
+        matrix = _rapidfuzz_process.cdist(
+            [norms[i].title for i in rows],
+            [norms[j].title for j in cols],
+            scorer=_rapidfuzz.ratio,
+            score_cutoff=cutoff,
+            dtype=_np.float64,
+        )
+        # Within a bucket only the upper triangle is needed (ratio is symmetric)
+        matrix[:, :len(rows)] = _np.triu(matrix[:, :len(rows)], k=1)
+        for r, c in zip(*_np.nonzero(matrix)):
+            i, j = rows[r], cols[c]
+            scores[(min(i, j), max(i, j))] = float(matrix[r, c]) / 100.0
+    return scores
+
+
+# Common security vulnerability terms
+_SECURITY_KEYWORDS = frozenset({
+    'sql', 'injection', 'sqli', 'xss', 'cross-site', 'csrf', 'authentication',
+    'authorization', 'access', 'control', 'bypass', 'privilege', 'escalation',
+    'hardcoded', 'secret', 'password', 'credential', 'token', 'key', 'api',
+    'deserialization', 'serialization', 'path', 'traversal', 'directory',
+    'command', 'execution', 'code', 'injection', 'ssrf', 'xxe', 'xxs',
+    'crypto', 'encryption', 'hash', 'weak', 'vulnerable', 'exposure',
+    'misconfiguration', 'security', 'vulnerability', 'flaw', 'weakness'
+})
+
+# Terms are matched as plain substrings ("sql" in "mysql"), so a zero-width
+# lookahead tries every position. Longest alternatives go first and each match
+# also yields the keywords that prefix it ("sqli" -> "sql"), so the result is
+# the same as testing every keyword with `in`.
+_SECURITY_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in sorted(_SECURITY_KEYWORDS, key=len, reverse=True)) + '))'
+)
+_KEYWORD_PREFIXES = {
+    kw: frozenset(other for other in _SECURITY_KEYWORDS if kw.startswith(other))
+    for kw in _SECURITY_KEYWORDS
+}
+
+# With pyahocorasick installed, one automaton pass reports every keyword
+# occurrence (overlapping and prefix matches included).
+if _ahocorasick is not None:
+    _SECURITY_AUTOMATON = _ahocorasick.Automaton()
+    for _keyword in _SECURITY_KEYWORDS:
+        _SECURITY_AUTOMATON.add_word(_keyword, _keyword)
+    _SECURITY_AUTOMATON.make_automaton()
+else:
+    _SECURITY_AUTOMATON = None
+
+
 def _extract_security_terms(text: str) -> Set[str]:
     """Extract security-related terms from text."""
-    # Common security vulnerability terms
-    security_keywords = {
-        'sql', 'injection', 'sqli', 'xss', 'cross-site', 'csrf', 'authentication',
-        'authorization', 'access', 'control', 'bypass', 'privilege', 'escalation',
-        'hardcoded', 'secret', 'password', 'credential', 'token', 'key', 'api',
-        'deserialization', 'serialization', 'path', 'traversal', 'directory',
-        'command', 'execution', 'code', 'injection', 'ssrf', 'xxe', 'xxs',
-        'crypto', 'encryption', 'hash', 'weak', 'vulnerable', 'exposure',
-        'misconfiguration', 'security', 'vulnerability', 'flaw', 'weakness'
-    }
-    
-    text_lower = text.lower()
-    found_terms = set()
-    
-    for keyword in security_keywords:
-        if keyword in text_lower:
-            found_terms.add(keyword)
+    if _SECURITY_AUTOMATON is not None:
+        return {keyword for _, keyword in _SECURITY_AUTOMATON.iter(text.lower())}
     
+    found_terms: Set[str] = set()
+    for keyword in set(_SECURITY_RE.findall(text.lower())):
+        found_terms |= _KEYWORD_PREFIXES[keyword]
     return found_terms
 
 
+def _find_root(parent: List[int], idx: int) -> int:
+    """Union-find root lookup with path halving."""
+    while parent[idx] != idx:
+        parent[idx] = parent[parent[idx]]
+        idx = parent[idx]
+    return idx
+
+
 def deduplicate_findings(
     findings: List[Dict[str, Any]],
     similarity_threshold: float = 0.7,
@@ -127,78 +332,108 @@ def deduplicate_findings(
     if not findings:
         return []
     
-    # Severity ordering for merge strategies
-    severity_order = {"CRITICAL": 4, "HIGH": 3, "MEDIUM": 2, "LOW": 1, "INFO": 0}
+    # Normalize every finding once; comparisons then only read attributes
+    norms = [_normalize(f) for f in findings]
+    
+    # Union-find parents; duplicate groups are the connected components, so
+    # grouping doesn't depend on which finding happens to come first
+    parent = list(range(len(findings)))
+    
+    # Exact duplicates (same file, line, title and category) always match and
+    # compare identically against everything else, so they are joined up front
+    # and only the first of each set goes through fuzzy matching.
+    # Findings without a title never match anything and are left out.
+    first_by_key: Dict[tuple, int] = {}
+    for idx, norm in enumerate(norms):
+        if norm.title:
+            first = first_by_key.setdefault((norm.file, norm.line, norm.title, norm.category), idx)
+            parent[idx] = first
+    representatives = list(first_by_key.values())
+    
+    # Group representatives by (file, line band) so only nearby ones are compared
+    buckets: Dict[tuple, List[int]] = defaultdict(list)
+    for idx in representatives:
+        buckets[_bucket_key(norms[idx])].append(idx)
+    
+    title_scores = _batch_title_scores(norms, buckets, similarity_threshold)
+    # Per-string SequenceMatcher cache for the difflib fallback
+    matchers: Dict[str, "SequenceMatcher"] = {}
+    
+    # Union every similar pair of representatives
+    for i in representatives:
+        norm = norms[i]
+        for key in _neighbor_keys(norm):
+            for j in buckets.get(key, ()):
+                if j <= i:
+                    continue
+                root_i, root_j = _find_root(parent, i), _find_root(parent, j)
+                if root_i == root_j:
+                    continue  # Already grouped, no need to score the pair
+                title_similarity = title_scores.get((i, j), 0.0) if title_scores is not None else None
+                if _normalized_similar(
+                    norm, norms[j], similarity_threshold, title_similarity, matchers
+                ):
+                    # Root at the lower index so each group keys on its first member
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+    
+    # Groups in order of their first member; members stay in input order
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for idx in range(len(findings)):
+        groups[_find_root(parent, idx)].append(idx)
     
     deduplicated: List[Dict[str, Any]] = []
-    processed_indices: Set[int] = set()
     
-    for i, finding1 in enumerate(findings):
-        if i in processed_indices:
-            continue
-        
-        # Find all similar findings
-        similar_findings = [finding1]
-        similar_indices = [i]
-        
-        for j, finding2 in enumerate(findings[i+1:], start=i+1):
-            if j in processed_indices:
-                continue
-            
-            if are_findings_similar(finding1, finding2, similarity_threshold):
-                similar_findings.append(finding2)
-                similar_indices.append(j)
-        
-        # Mark all similar findings as processed
-        processed_indices.update(similar_indices)
+    for similar_indices in groups.values():
+        i = similar_indices[0]
+        finding1 = findings[i]
         
         # Merge similar findings based on strategy
-        if len(similar_findings) == 1:
+        if len(similar_indices) == 1:
             # No duplicates, just add it
             deduplicated.append(finding1)
+        elif merge_strategy == "keep_first":
+            deduplicated.append(finding1)
         else:
-            # Merge duplicates
+            # One walk over the group collects sources, recommendations and
+            # the highest-severity finding (first wins on ties)
+            best_index = i
+            sources = []
+            recommendations = []
+            for k in similar_indices:
+                f = findings[k]
+                if norms[k].severity_rank > norms[best_index].severity_rank:
+                    best_index = k
+                source = f.get('source')
+                if source:
+                    sources.append(source)
+                recommendation = f.get('recommendation') or f.get('fix') or f.get('explanation')
+                if recommendation and recommendation != 'N/A':
+                    recommendations.append(recommendation)
+            # Unique values in the order the profiles reported them
+            unique_sources = list(dict.fromkeys(sources))
+            
             if merge_strategy == "keep_highest_severity":
-                # Find highest severity
-                best_finding = max(
-                    similar_findings,
-                    key=lambda f: severity_order.get(
-                        str(f.get('severity', 'LOW')).upper(), 0
-                    )
-                )
+                best_finding = findings[best_index]
                 # Add profile sources
-                sources = [f.get('source', '') for f in similar_findings if f.get('source')]
                 if sources:
                     best_finding = best_finding.copy()
-                    if len(set(sources)) > 1:
-                        best_finding['source'] = ', '.join(sorted(set(sources)))
+                    if len(unique_sources) > 1:
+                        best_finding['source'] = ', '.join(unique_sources)
                         best_finding['profiles'] = sources  # Track which profiles found it
                 deduplicated.append(best_finding)
                 
-            elif merge_strategy == "keep_first":
-                deduplicated.append(finding1)
-                
             elif merge_strategy == "merge":
                 # Merge all information
                 merged = finding1.copy()
                 # Combine sources
-                sources = [f.get('source', '') for f in similar_findings if f.get('source')]
                 if sources:
-                    merged['source'] = ', '.join(sorted(set(sources)))
+                    merged['source'] = ', '.join(unique_sources)
                     merged['profiles'] = sources
                 # Use highest severity
-                merged['severity'] = max(
-                    (f.get('severity', 'LOW') for f in similar_findings),
-                    key=lambda s: severity_order.get(str(s).upper(), 0)
-                )
-                # Combine recommendations (take longest/most detailed)
-                recommendations = [
-                    f.get('recommendation') or f.get('fix') or f.get('explanation') or ''
-                    for f in similar_findings
-                ]
-                recommendations = [r for r in recommendations if r and r != 'N/A']
+                merged['severity'] = findings[best_index].get('severity', 'LOW')
+                # Combine recommendations
                 if recommendations:
-                    merged['recommendation'] = ' | '.join(sorted(set(recommendations)))
+                    merged['recommendation'] = ' | '.join(dict.fromkeys(recommendations))
                 deduplicated.append(merged)
     
     return deduplicated
@@ -7,9 +7,16 @@ Creates beautiful box diagrams showing taint flow across files.
 
 from typing import List, Tuple
 from pathlib import Path
+from lib.common import cached_path
 from lib.taint_tracker import TaintFlow, TaintSource, TaintSink
 
 
+# Horizontal rules, built once rather than per diagram
+_RULE = "─" * 70
+_BANNER_RULE = "═" * 68
+_SUMMARY_RULE = "═" * 70
+
+
 class FlowVisualizer:
     """Generate ASCII art for attack chains."""
     
@@ -56,15 +63,15 @@ class FlowVisualizer:
                 f"Exploitability: {flow.exploitability_score}/10 | " \
                 f"Confidence: {flow.confidence:.0%}"
         
-        lines.append("┌─ " + title)
-        lines.append("│  " + stats)
-        lines.append("├" + "─" * 70)
+        lines.append(f"┌─ {title}")
+        lines.append(f"│  {stats}")
+        lines.append(f"├{_RULE}")
         lines.append("│")
         
         # Source
-        source_file = Path(flow.source.file).name
-        lines.append("│  📥 SOURCE: " + f"{source_file}:L{flow.source.line} [{flow.source.source_type}]")
-        lines.append("│     └─ Variable: " + flow.source.variable)
+        source_file = cached_path(flow.source.file).name
+        lines.append(f"│  📥 SOURCE: {source_file}:L{flow.source.line} [{flow.source.source_type}]")
+        lines.append(f"│     └─ Variable: {flow.source.variable}")
         lines.append("│")
         
         # Hops
@@ -72,9 +79,9 @@ class FlowVisualizer:
             lines.append("│          ↓")
             lines.append("│")
             
-            hop_file_name = Path(hop_file).name
-            lines.append("│  🔄 HOP " + f"{i}: {hop_file_name}:L{hop_line}")
-            lines.append("│     └─ " + hop_desc)
+            hop_file_name = cached_path(hop_file).name
+            lines.append(f"│  🔄 HOP {i}: {hop_file_name}:L{hop_line}")
+            lines.append(f"│     └─ {hop_desc}")
             lines.append("│")
         
         # Arrow to sink
@@ -82,21 +89,21 @@ class FlowVisualizer:
         lines.append("│")
         
         # Sink
-        sink_file = Path(flow.sink.file).name
-        lines.append("│  💥 SINK: " + f"{sink_file}:L{flow.sink.line} [{flow.sink.sink_type}]")
-        lines.append("│     └─ " + flow.sink.function)
+        sink_file = cached_path(flow.sink.file).name
+        lines.append(f"│  💥 SINK: {sink_file}:L{flow.sink.line} [{flow.sink.sink_type}]")
+        lines.append(f"│     └─ {flow.sink.function}")
         lines.append("│")
         
         # Analysis
         if not flow.sanitization_attempts:
             lines.append("│  ⚠️  NO SANITIZATION DETECTED")
         else:
-            lines.append("│  ✓ Sanitization: " + ', '.join(flow.sanitization_attempts))
+            lines.append(f"│  ✓ Sanitization: {', '.join(flow.sanitization_attempts)}")
         
         exploit_level = "HIGH" if flow.exploitability_score >= 7 else "MEDIUM" if flow.exploitability_score >= 4 else "LOW"
-        lines.append("│  ⚡ EXPLOITABILITY: " + f"{flow.exploitability_score}/10 ({exploit_level})")
-        lines.append("│  🎯 CONFIDENCE: " + f"{flow.confidence:.0%}")
-        lines.append("└" + "─" * 70)
+        lines.append(f"│  ⚡ EXPLOITABILITY: {flow.exploitability_score}/10 ({exploit_level})")
+        lines.append(f"│  🎯 CONFIDENCE: {flow.confidence:.0%}")
+        lines.append(f"└{_RULE}")
         
         return "\n".join(lines)
     
@@ -108,9 +115,9 @@ class FlowVisualizer:
         
         output = []
         output.append("")
-        output.append("╔" + "═" * 68)
+        output.append(f"╔{_BANNER_RULE}")
         output.append("║ 🔗 ATTACK CHAINS DETECTED")
-        output.append("╚" + "═" * 68)
+        output.append(f"╚{_BANNER_RULE}")
         output.append("")
         
         # Sort by exploitability
@@ -118,9 +125,9 @@ class FlowVisualizer:
         
         for i, flow in enumerate(sorted_flows[:max_flows], 1):
             output.append("")
-            output.append("─" * 70)
+            output.append(_RULE)
             output.append(f"Chain #{i}")
-            output.append("─" * 70)
+            output.append(_RULE)
             output.append(FlowVisualizer.visualize_flow(flow))
         
         if len(flows) > max_flows:
@@ -135,9 +142,9 @@ class FlowVisualizer:
             return ""
         
         lines = []
-        lines.append("\n" + "═" * 70)
+        lines.append(f"\n{_SUMMARY_RULE}")
         lines.append("ATTACK CHAIN SUMMARY")
-        lines.append("═" * 70 + "\n")
+        lines.append(f"{_SUMMARY_RULE}\n")
         
         # Group by sink type
         by_type = {}
@@ -152,8 +159,8 @@ class FlowVisualizer:
             
             # Show top 3 for this type
             for flow in type_flows[:3]:
-                source_file = Path(flow.source.file).name
-                sink_file = Path(flow.sink.file).name
+                source_file = cached_path(flow.source.file).name
+                sink_file = cached_path(flow.sink.file).name
                 
                 if source_file == sink_file:
                     lines.append(f"  • {source_file} (same-file, ⚡{flow.exploitability_score}/10)")
@@ -169,17 +176,10 @@ class FlowVisualizer:
     @staticmethod
     def create_simple_flow_diagram(source_file: str, sink_file: str, hops: List[str]) -> str:
         """Create a simple linear flow diagram."""
-        files = [Path(source_file).name]
-        files.extend(Path(hop).name for hop in hops if hop not in [source_file, sink_file])
-        files.append(Path(sink_file).name)
+        files = [cached_path(source_file).name]
+        files.extend(cached_path(hop).name for hop in hops if hop not in [source_file, sink_file])
+        files.append(cached_path(sink_file).name)
         
         # Deduplicate while preserving order
-        seen = set()
-        unique_files = []
-        for f in files:
-            if f not in seen:
-                seen.add(f)
-                unique_files.append(f)
-        
-        return " → ".join(unique_files)
+        return " → ".join(dict.fromkeys(files))
 
@@ -25,11 +25,14 @@ Environment Variables:
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
 import sys
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
+_log = logging.getLogger(__name__)
 
 # ============================================================================
 # Model Definitions
@@ -181,9 +184,13 @@ CURRENT_MODELS: Tuple[ModelDef, ...] = tuple(m for m in ALL_MODELS if not m.depr
 _MODEL_BY_ID: Dict[str, ModelDef] = {m.model_id: m for m in ALL_MODELS}
 _MODEL_BY_ALIAS: Dict[str, ModelDef] = {}
 for _m in ALL_MODELS:
+    # Aliases and IDs are defined lowercase, so they are used as keys directly
     for _alias in _m.aliases:
-        _MODEL_BY_ALIAS[_alias.lower()] = _m
-    _MODEL_BY_ALIAS[_m.model_id.lower()] = _m
+        _MODEL_BY_ALIAS[_alias] = _m
+    _MODEL_BY_ALIAS[_m.model_id] = _m
+
+# Listed in the error for unrecognized model names
+_AVAILABLE_MSG: str = ", ".join(m.model_id for m in CURRENT_MODELS)
 
 # Valid choices for CLI --model argument
 MODEL_CHOICES: List[str] = sorted(set(
@@ -215,33 +222,45 @@ def resolve_model(model_input: str) -> str:
 
     Raises ValueError if the model is not recognized.
     """
-    lookup = model_input.strip().lower()
-    model_def = _MODEL_BY_ALIAS.get(lookup)
+    return _lookup_model(model_input).model_id
+
+
+def get_model_def(model_input: str) -> ModelDef:
+    """
+    Resolve a model name/alias/ID and return the full ModelDef.
+    """
+    return _lookup_model(model_input)
+
+
+@functools.lru_cache(maxsize=64)
+def _find_model(model_input: str) -> Optional[ModelDef]:
+    """Find the ModelDef for a name/alias/ID, or None if it is unknown."""
+    # Most callers pass a canonical ID or alias already, so try it verbatim
+    # before normalizing
+    model_def = _MODEL_BY_ALIAS.get(model_input)
+    if model_def is None:
+        model_def = _MODEL_BY_ALIAS.get(model_input.strip().lower())
+    return model_def
+
+
+def _lookup_model(model_input: str) -> ModelDef:
+    """Find the ModelDef for a name/alias/ID, warning if it is deprecated."""
+    model_def = _find_model(model_input)
 
     if model_def is None:
-        available = ", ".join(m.model_id for m in CURRENT_MODELS)
         raise ValueError(
             f"Unknown model: '{model_input}'. "
-            f"Available models: {available}. "
+            f"Available models: {_AVAILABLE_MSG}. "
             f"Short names: opus, sonnet, haiku"
         )
 
     if model_def.deprecated:
-        import logging
-        logging.getLogger(__name__).warning(
+        _log.warning(
             f"Model '{model_def.model_id}' is deprecated. "
             f"Consider upgrading to a current model."
         )
 
-    return model_def.model_id
-
-
-def get_model_def(model_input: str) -> ModelDef:
-    """
-    Resolve a model name/alias/ID and return the full ModelDef.
-    """
-    model_id = resolve_model(model_input)
-    return _MODEL_BY_ID[model_id]
+    return model_def
 
 
 def get_default_model() -> str:
@@ -257,14 +276,26 @@ def get_default_model() -> str:
         try:
             return resolve_model(env_model)
         except ValueError:
-            import logging
-            logging.getLogger(__name__).warning(
+            _log.warning(
                 f"CLAUDE_MODEL env var '{env_model}' is not recognized. "
                 f"Falling back to default: {DEFAULT_MODEL_ID}"
             )
     return DEFAULT_MODEL_ID
 
 
+# Base max_tokens by (model tier, stage)
+# These must be generous enough for full structured JSON output.
+# All current models support 64K+ output, so headroom is cheap.
+_TIER_STAGE_TOKENS: Dict[Tuple[str, str], int] = {
+    ("opus", "prioritization"): 6000, ("opus", "analysis"): 12000, ("opus", "synthesis"): 12000,
+    ("opus", "payload"): 6000, ("opus", "annotation"): 6000, ("opus", "threat_modeling"): 12000,
+    ("sonnet", "prioritization"): 5000, ("sonnet", "analysis"): 10000, ("sonnet", "synthesis"): 10000,
+    ("sonnet", "payload"): 5000, ("sonnet", "annotation"): 5000, ("sonnet", "threat_modeling"): 10000,
+    ("haiku", "prioritization"): 4000, ("haiku", "analysis"): 8000, ("haiku", "synthesis"): 8000,
+    ("haiku", "payload"): 4000, ("haiku", "annotation"): 4000, ("haiku", "threat_modeling"): 8000,
+}
+
+
 def get_model_max_tokens(model_input: str, stage: str = "analysis") -> int:
     """
     Get recommended max_tokens for a model and analysis stage.
@@ -285,17 +316,7 @@ def get_model_max_tokens(model_input: str, stage: str = "analysis") -> int:
     except ValueError:
         model_def = DEFAULT_MODEL_DEF
 
-    # Base tokens by model tier
-    # These must be generous enough for full structured JSON output.
-    # All current models support 64K+ output, so headroom is cheap.
-    tier_base = {
-        "opus":   {"prioritization": 6000, "analysis": 12000, "synthesis": 12000, "payload": 6000, "annotation": 6000, "threat_modeling": 12000},
-        "sonnet": {"prioritization": 5000, "analysis": 10000, "synthesis": 10000, "payload": 5000, "annotation": 5000, "threat_modeling": 10000},
-        "haiku":  {"prioritization": 4000, "analysis": 8000,  "synthesis": 8000,  "payload": 4000, "annotation": 4000, "threat_modeling": 8000},
-    }
-
-    tier_tokens = tier_base.get(model_def.tier, tier_base["haiku"])
-    return tier_tokens.get(stage, 4096)
+    return _TIER_STAGE_TOKENS.get((model_def.tier, stage), 4096)
 
 
 def get_model_pricing(model_input: str) -> Tuple[float, float]:
@@ -8,16 +8,136 @@ code improvement reports.
 
 from __future__ import annotations
 
+import html
+import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster report JSON, stdlib json used otherwise
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from lib.common import cached_path
 from lib.models import AnalysisReport, Finding
 
 
+if orjson is not None:
+    def _dumps_indented(obj: Any) -> str:
+        """Encode obj as JSON with 2-space indentation."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+    def _dumps_line(obj: Any) -> str:
+        """Encode obj as single-line JSON."""
+        return orjson.dumps(obj).decode("utf-8")
+else:
+    def _dumps_indented(obj: Any) -> str:
+        """Encode obj as JSON with 2-space indentation."""
+        return json.dumps(obj, indent=2)
+
+    def _dumps_line(obj: Any) -> str:
+        """Encode obj as single-line JSON."""
+        return json.dumps(obj)
+
+
+def _finding_record(f: Finding) -> Dict[str, Any]:
+    """The JSON fields exported for a finding."""
+    return {
+        "file_path": f.file_path,
+        "finding": f.finding,
+        "recommendation": f.recommendation,
+        "impact": f.impact,
+        "relevance": f.relevance,
+        "line_number": f.line_number,
+    }
+
+
+def _write_json_report(fh: TextIO, report: AnalysisReport) -> None:
+    """
+    Stream a report as JSON, one finding at a time.
+
+    Output is identical to json.dumps() of the whole report with indent=2,
+    without building the full findings list or document in memory. With
+    orjson installed, non-ASCII text is written as UTF-8 instead of \\u
+    escapes, as in dump_findings().
+    """
+    header = {
+        "repo_path": report.repo_path,
+        "question": report.question,
+        "timestamp": report.timestamp,
+        "file_count": report.file_count,
+        "synthesis": report.synthesis,
+    }
+    fh.write("{\n")
+    for key, value in header.items():
+        fh.write(f"  {_dumps_indented(key)}: {_dumps_indented(value)},\n")
+    fh.write('  "findings": [')
+
+    separator = "\n    "
+    for f in report.insights:
+        finding = _finding_record(f)
+        # Encoded strings never contain raw newlines, so re-indenting the
+        # object's own lines nests it at the array's depth
+        fh.write(separator)
+        fh.write(_dumps_indented(finding).replace("\n", "\n    "))
+        separator = ",\n    "
+
+    fh.write("\n  ]\n}" if report.insights else "]\n}")
+
+
+def _write_ndjson_report(fh: TextIO, report: AnalysisReport) -> None:
+    """
+    Write findings as newline-delimited JSON, one finding object per line.
+
+    Records have the same fields as the JSON report's findings, so each
+    line can be parsed on its own (e.g. with jq -c) without loading the
+    whole report.
+    """
+    for f in report.insights:
+        fh.write(_dumps_line(_finding_record(f)))
+        fh.write("\n")
+
+
+def _write_markdown_report(fh: TextIO, report: AnalysisReport) -> None:
+    """Stream a report as Markdown, writing one table row per finding."""
+    fh.write("\n".join([
+        "# Analysis Report",
+        f"**Repository:** {report.repo_path}",
+        f"**Question:** {report.question}",
+        f"**Files analyzed:** {report.file_count}",
+        f"**Findings:** {len(report.insights)}",
+        "",
+        "## Synthesis",
+        report.synthesis,
+        "",
+        "## Findings",
+        "| Impact | File | Finding | Recommendation |",
+        "|--------|------|---------|----------------|",
+    ]))
+    for f in report.insights:
+        rec = f.recommendation[:40] + "..." if len(f.recommendation) > 40 else f.recommendation
+        find = f.finding[:60] + "..." if len(f.finding) > 60 else f.finding
+        fh.write(f"\n| {f.impact} | {cached_path(f.file_path).name} | {find} | {rec} |")
+
+
+def _write_html_report(fh: TextIO, report: AnalysisReport) -> None:
+    """Stream a report as HTML, escaping all report text."""
+    fh.write(f"""<!DOCTYPE html><html><head><title>Analysis Report</title></head><body>
+<h1>Analysis Report</h1><p><b>Repo:</b> {html.escape(report.repo_path)}</p><p><b>Question:</b> {html.escape(report.question)}</p>
+<h2>Synthesis</h2><p>{html.escape(report.synthesis[:2000])}</p>
+<h2>Findings</h2><table border="1"><tr><th>Impact</th><th>File</th><th>Finding</th></tr>""")
+    for f in report.insights:
+        fh.write(
+            f"<tr><td>{html.escape(f.impact)}</td><td>{html.escape(cached_path(f.file_path).name)}</td>"
+            f"<td>{html.escape(f.finding[:80])}</td></tr>"
+        )
+    fh.write("</table></body></html>")
+
+
 class OutputManager:
     """Manages output display and report export for analysis results."""
 
@@ -45,7 +165,7 @@ class OutputManager:
                 impact_color = {"CRITICAL": "red", "HIGH": "yellow", "MEDIUM": "cyan", "LOW": "dim"}.get(f.impact, "white")
                 table.add_row(
                     f"[{impact_color}]{f.impact}[/{impact_color}]",
-                    Path(f.file_path).name,
+                    cached_path(f.file_path).name,
                     f.finding[:80] + "..." if len(f.finding) > 80 else f.finding,
                 )
             self.console.print(table)
@@ -59,7 +179,12 @@ class OutputManager:
         formats: List[str],
         output: Optional[Path] = None,
     ) -> None:
-        """Save report to JSON, Markdown, and/or HTML."""
+        """
+        Save report to JSON, NDJSON, Markdown, and/or HTML.
+
+        "ndjson" writes only the findings, one JSON object per line, for
+        consumers that stream-parse records instead of loading the report.
+        """
         if output:
             p = Path(output)
             base = p.parent / p.stem if p.suffix else p
@@ -69,71 +194,38 @@ class OutputManager:
             if fmt == "json":
                 path = base.with_suffix(".json")
                 path.parent.mkdir(parents=True, exist_ok=True)
-                data = {
-                    "repo_path": report.repo_path,
-                    "question": report.question,
-                    "timestamp": report.timestamp,
-                    "file_count": report.file_count,
-                    "synthesis": report.synthesis,
-                    "findings": [
-                        {
-                            "file_path": f.file_path,
-                            "finding": f.finding,
-                            "recommendation": f.recommendation,
-                            "impact": f.impact,
-                            "relevance": f.relevance,
-                            "line_number": f.line_number,
-                        }
-                        for f in report.insights
-                    ],
-                }
-                import json
-                path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                with path.open("w", encoding="utf-8") as fh:
+                    _write_json_report(fh, report)
                 self.console.print(f"[green]✓[/green] JSON report: {path}")
+            elif fmt == "ndjson":
+                path = base.with_suffix(".ndjson")
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("w", encoding="utf-8") as fh:
+                    _write_ndjson_report(fh, report)
+                self.console.print(f"[green]✓[/green] NDJSON findings: {path}")
             elif fmt == "markdown":
                 path = base.with_suffix(".md")
                 path.parent.mkdir(parents=True, exist_ok=True)
-                lines = [
-                    f"# Analysis Report",
-                    f"**Repository:** {report.repo_path}",
-                    f"**Question:** {report.question}",
-                    f"**Files analyzed:** {report.file_count}",
-                    f"**Findings:** {len(report.insights)}",
-                    "",
-                    "## Synthesis",
-                    report.synthesis,
-                    "",
-                    "## Findings",
-                    "| Impact | File | Finding | Recommendation |",
-                    "|--------|------|---------|----------------|",
-                ]
-                for f in report.insights:
-                    rec = f.recommendation[:40] + "..." if len(f.recommendation) > 40 else f.recommendation
-                    find = f.finding[:60] + "..." if len(f.finding) > 60 else f.finding
-                    lines.append(f"| {f.impact} | {Path(f.file_path).name} | {find} | {rec} |")
-                path.write_text("\n".join(lines), encoding="utf-8")
+                with path.open("w", encoding="utf-8") as fh:
+                    _write_markdown_report(fh, report)
                 self.console.print(f"[green]✓[/green] Markdown report: {path}")
             elif fmt == "html":
                 path = base.with_suffix(".html")
                 path.parent.mkdir(parents=True, exist_ok=True)
-                rows = "".join(
-                    f"<tr><td>{f.impact}</td><td>{Path(f.file_path).name}</td><td>{f.finding[:80]}</td></tr>"
-                    for f in report.insights
-                )
-                html = f"""<!DOCTYPE html><html><head><title>Analysis Report</title></head><body>
-<h1>Analysis Report</h1><p><b>Repo:</b> {report.repo_path}</p><p><b>Question:</b> {report.question}</p>
-<h2>Synthesis</h2><p>{report.synthesis[:2000]}</p>
-<h2>Findings</h2><table border="1"><tr><th>Impact</th><th>File</th><th>Finding</th></tr>{rows}</table></body></html>"""
-                path.write_text(html, encoding="utf-8")
+                with path.open("w", encoding="utf-8") as fh:
+                    _write_html_report(fh, report)
                 self.console.print(f"[green]✓[/green] HTML report: {path}")
 
     def display_code_improvements(self, improvements: Dict[str, Any]) -> None:
         """Display code improvement suggestions in the console."""
         self.console.print(Panel("[bold]Code Improvement Suggestions[/bold]", border_style="green"))
+        lines: List[str] = []
         for file_path, items in improvements.items():
-            self.console.print(f"\n[cyan]{Path(file_path).name}[/cyan]")
+            lines.append(f"\n[cyan]{cached_path(file_path).name}[/cyan]")
             for item in items:
-                self.console.print(f"  • {item.get('suggestion', item)}")
+                lines.append(f"  • {item.get('suggestion', item)}")
+        if lines:
+            self.console.print("\n".join(lines))
 
     def save_improvement_report(self, improvements: Dict[str, Any], output_path: Path) -> None:
         """Save code improvement report to a Markdown file."""
@@ -155,8 +247,18 @@ class OutputManager:
     ) -> None:
         """Write optimized code to files."""
         output_path.mkdir(parents=True, exist_ok=True)
-        for rel_path, content in optimized_code.items():
-            out_file = output_path / rel_path
-            out_file.parent.mkdir(parents=True, exist_ok=True)
-            out_file.write_text(content, encoding="utf-8")
-            self.console.print(f"[green]✓[/green] Wrote {out_file}")
+        created_dirs: Set[Path] = {output_path}
+        written: List[str] = []
+        try:
+            for rel_path, content in optimized_code.items():
+                out_file = output_path / rel_path
+                if out_file.parent not in created_dirs:
+                    out_file.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(out_file.parent)
+                out_file.write_text(content, encoding="utf-8")
+                written.append(f"[green]✓[/green] Wrote {out_file}")
+        finally:
+            # One print for the whole batch; files written before a failure
+            # are still reported
+            if written:
+                self.console.print("\n".join(written))
@@ -9,15 +9,23 @@ per file — reducing API calls and cost while preserving all analysis guidance.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 BASE_DIR = PROMPTS_DIR / "base"
 PROFILES_DIR = PROMPTS_DIR / "profiles"
 
+_RULE = "═" * 75
+_PROFILE_HEADER = f"\n\n{_RULE}\nPROFILE-SPECIFIC GUIDANCE\n{_RULE}\n\n"
+_CODE_FOOTER = "\n\nCODE TO ANALYZE:\n{code}"
 
+
+# Prompt files are static for the life of the process, so reads and
+# compositions are cached rather than repeated for every analyzed file.
+@functools.lru_cache(maxsize=None)
 def _read_if_exists(path: Path) -> str:
     """Read file or return empty string."""
     if path.is_file():
@@ -25,6 +33,7 @@ def _read_if_exists(path: Path) -> str:
     return ""
 
 
+@functools.lru_cache(maxsize=None)
 def get_base_prompt() -> str:
     """Load and concatenate base prompt components."""
     preamble = _read_if_exists(BASE_DIR / "system_preamble.txt")
@@ -35,6 +44,7 @@ def get_base_prompt() -> str:
     return "\n\n".join(parts)
 
 
+@functools.lru_cache(maxsize=None)
 def get_profile_section(profile: str) -> Optional[str]:
     """Load profile-specific section if it exists."""
     section_file = PROFILES_DIR / f"{profile}_sections.txt"
@@ -58,6 +68,15 @@ def compose_prompt(
         Composed prompt string, or None if composition not possible
         (e.g. base missing, or all profiles use legacy only).
     """
+    return _compose_prompt(tuple(profile_names), use_legacy_fallback)
+
+
+@functools.lru_cache(maxsize=None)
+def _compose_prompt(
+    profile_names: Tuple[str, ...],
+    use_legacy_fallback: bool,
+) -> Optional[str]:
+    """Cached implementation of compose_prompt (profile names as a tuple)."""
     base = get_base_prompt()
     if not base:
         return None
@@ -73,8 +92,8 @@ def compose_prompt(
 
     if sections:
         profile_block = "\n\n---\n\n".join(sections)
-        return f"{base}\n\n═══════════════════════════════════════════════════════════════════════════\nPROFILE-SPECIFIC GUIDANCE\n═══════════════════════════════════════════════════════════════════════════\n\n{profile_block}\n\nCODE TO ANALYZE:\n{{code}}"
-    return base + "\n\nCODE TO ANALYZE:\n{code}"
+        return "".join([base, _PROFILE_HEADER, profile_block, _CODE_FOOTER])
+    return base + _CODE_FOOTER
 
 
 def get_merged_prompt(
@@ -122,7 +141,7 @@ def get_merged_prompt(
 
 def has_composed_support(profile_names: List[str]) -> bool:
     """True if we have base + at least one profile section for these profiles."""
-    if not get_base_prompt():
-        return False
     file_profiles = [p for p in profile_names if p != "attacker"]
+    if not file_profiles or not get_base_prompt():
+        return False
     return any(get_profile_section(p) for p in file_profiles)
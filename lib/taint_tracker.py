@@ -6,13 +6,19 @@ Traces data flow from sources (user input) through transformations
 to sinks (dangerous functions) across multiple files.
 """
 
+import functools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterator, List, Set, Optional, Tuple
 from dataclasses import dataclass
 import re
 
+from lib.common import cached_path
 
-@dataclass
+
+@dataclass(slots=True)
 class TaintSource:
     """Represents a source of tainted (user-controlled) data."""
     file: str
@@ -22,10 +28,10 @@ class TaintSource:
     function: Optional[str] = None
     
     def __str__(self):
-        return f"{Path(self.file).name}:L{self.line} [{self.source_type}] {self.variable}"
+        return f"{cached_path(self.file).name}:L{self.line} [{self.source_type}] {self.variable}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaintSink:
     """Represents a dangerous function that uses tainted data."""
     file: str
@@ -35,10 +41,10 @@ class TaintSink:
     variable: Optional[str] = None
     
     def __str__(self):
-        return f"{Path(self.file).name}:L{self.line} [{self.sink_type}] {self.function}"
+        return f"{cached_path(self.file).name}:L{self.line} [{self.sink_type}] {self.function}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaintFlow:
     """Represents a data flow from source to sink."""
     source: TaintSource
@@ -56,6 +62,8 @@ class TaintFlow:
     @property
     def file_count(self) -> int:
         """Number of files in the chain."""
+        if not self.hops:
+            return 1 if self.source.file == self.sink.file else 2
         files = {self.source.file, self.sink.file}
         files.update(hop[0] for hop in self.hops)
         return len(files)
@@ -176,14 +184,7 @@ class TaintTracker:
     @staticmethod
     def detect_language(file_path: Path) -> Optional[str]:
         """Detect programming language from file extension."""
-        ext_map = {
-            '.py': 'python',
-            '.js': 'javascript', '.ts': 'javascript', '.jsx': 'javascript', '.tsx': 'javascript',
-            '.php': 'php',
-            '.java': 'java',
-            '.go': 'go'
-        }
-        return ext_map.get(file_path.suffix.lower())
+        return _language_for_suffix(file_path.suffix)
     
     @staticmethod
     def find_sources_in_file(file_path: Path, content: str) -> List[TaintSource]:
@@ -192,20 +193,26 @@ class TaintTracker:
         if not lang or lang not in TaintTracker.TAINT_SOURCES:
             return []
         
+        if not _may_contain_any(content, _SOURCE_NEEDLES[lang]):
+            return []
+        
         sources = []
-        source_patterns = TaintTracker.TAINT_SOURCES[lang]
+        source_patterns = _COMPILED_SOURCES[lang]
+        # Shared by every source in the file and by its sinks
+        file = sys.intern(str(file_path))
         
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in _candidate_lines(content, _ANY_SOURCE[lang]):
+            var_name = None
             for source_type, patterns in source_patterns.items():
                 for pattern in patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        # Extract variable name if possible
-                        var_match = re.search(r'(\w+)\s*=', line)
-                        var_name = var_match.group(1) if var_match else 'input'
+                    if pattern.search(line):
+                        # Extract variable name if possible, once per line
+                        if var_name is None:
+                            var_match = _ASSIGNMENT_RE.search(line)
+                            var_name = var_match.group(1) if var_match else 'input'
                         
                         sources.append(TaintSource(
-                            file=str(file_path),
+                            file=file,
                             line=line_num,
                             variable=var_name,
                             source_type=source_type
@@ -221,18 +228,21 @@ class TaintTracker:
         if not lang or lang not in TaintTracker.TAINT_SINKS:
             return []
         
+        if not _may_contain_any(content, _SINK_NEEDLES[lang]):
+            return []
+        
         sinks = []
-        sink_patterns = TaintTracker.TAINT_SINKS[lang]
+        sink_patterns = _COMPILED_SINKS[lang]
+        file = sys.intern(str(file_path))
         
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in _candidate_lines(content, _ANY_SINK[lang]):
             for sink_type, patterns in sink_patterns.items():
                 for pattern in patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
+                    match = pattern.search(line)
                     if match:
                         function_name = match.group(0)
                         sinks.append(TaintSink(
-                            file=str(file_path),
+                            file=file,
                             line=line_num,
                             function=function_name,
                             sink_type=sink_type
@@ -246,30 +256,209 @@ class TaintTracker:
         """Find function calls in code (for tracing flow between files)."""
         function_calls = []
         
-        # Language-specific function call patterns
-        patterns = {
-            'python': r'(\w+)\s*\(',
-            'javascript': r'(\w+)\s*\(',
-            'php': r'(\w+)\s*\(',
-            'java': r'(\w+)\s*\(',
-            'go': r'(\w+)\s*\('
-        }
-        
-        if lang not in patterns:
+        pattern = _FUNCTION_CALL_PATTERNS.get(lang)
+        if pattern is None:
             return []
         
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            matches = re.finditer(patterns[lang], line)
-            for match in matches:
-                func_name = match.group(1)
-                # Filter out common non-function words
-                if func_name not in ['if', 'for', 'while', 'return', 'def', 'class', 'import']:
-                    function_calls.append((func_name, line_num))
+        # Scan the whole content; line numbers come from counting newlines
+        # between consecutive matches, so the file is never split into lines
+        line_num = 1
+        last_pos = 0
+        for match in pattern.finditer(content):
+            func_name = match.group(1)
+            # Filter out common non-function words
+            if func_name not in _NON_FUNCTION_WORDS:
+                line_num += content.count('\n', last_pos, match.start())
+                last_pos = match.start()
+                function_calls.append((func_name, line_num))
         
         return function_calls
 
 
+@functools.lru_cache(maxsize=None)
+def _language_for_suffix(suffix: str) -> Optional[str]:
+    """Map a file suffix (any case) to a language; cached per suffix."""
+    ext_map = {
+        '.py': 'python',
+        '.js': 'javascript', '.ts': 'javascript', '.jsx': 'javascript', '.tsx': 'javascript',
+        '.php': 'php',
+        '.java': 'java',
+        '.go': 'go'
+    }
+    return ext_map.get(suffix.lower())
+
+
+# Several patterns (eval, exec, execute, ...) recur across languages; each
+# distinct string is compiled once and the Pattern shared between tables
+_PATTERN_POOL: Dict[str, re.Pattern] = {}
+
+
+def _pooled_pattern(pattern: str) -> re.Pattern:
+    """Compile pattern case-insensitively, reusing an earlier compilation."""
+    compiled = _PATTERN_POOL.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_POOL[pattern] = re.compile(pattern, re.IGNORECASE)
+    return compiled
+
+
+def _compile_pattern_table(
+    table: Dict[str, Dict[str, List[str]]]
+) -> Dict[str, Dict[str, List[re.Pattern]]]:
+    """Compile a {language: {kind: [regex, ...]}} table case-insensitively."""
+    return {
+        lang: {
+            kind: [_pooled_pattern(pattern) for pattern in patterns]
+            for kind, patterns in kinds.items()
+        }
+        for lang, kinds in table.items()
+    }
+
+
+# Patterns compiled once at import instead of per line via re.search
+_COMPILED_SOURCES = _compile_pattern_table(TaintTracker.TAINT_SOURCES)
+_COMPILED_SINKS = _compile_pattern_table(TaintTracker.TAINT_SINKS)
+_ASSIGNMENT_RE = re.compile(r'(\w+)\s*=')
+
+
+def _union_pattern_table(table: Dict[str, Dict[str, List[str]]]) -> Dict[str, re.Pattern]:
+    """Compile one alternation of every pattern per language."""
+    return {
+        lang: re.compile(
+            '|'.join(f'(?:{pattern})' for patterns in kinds.values() for pattern in patterns),
+            re.IGNORECASE,
+        )
+        for lang, kinds in table.items()
+    }
+
+
+# Per-language "does anything match" patterns used to skip lines quickly
+_ANY_SOURCE = _union_pattern_table(TaintTracker.TAINT_SOURCES)
+_ANY_SINK = _union_pattern_table(TaintTracker.TAINT_SINKS)
+
+
+_REGEX_SPECIAL = frozenset('.^$*+?{}[]|()')
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Lowercased literal text every match of pattern must start with.
+    
+    Returns '' when there is no such prefix (pattern starts with a class,
+    group or escape like \\s, or has a top-level alternation).
+    """
+    depth = 0
+    escaped = False
+    for c in pattern:
+        if escaped:
+            escaped = False
+        elif c == '\\':
+            escaped = True
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif c == '|' and depth == 0:
+            return ''
+    
+    chars = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                break  # Character class escape (\\s, \\w, ...)
+            literal, step = pattern[i + 1], 2
+        elif c in _REGEX_SPECIAL:
+            break
+        else:
+            literal, step = c, 1
+        if pattern[i + step:i + step + 1] in ('*', '?', '{'):
+            break  # Quantified, so not necessarily present
+        chars.append(literal)
+        i += step
+    return ''.join(chars).lower()
+
+
+def _needle_table(table: Dict[str, Dict[str, List[str]]]) -> Dict[str, Optional[Tuple[str, ...]]]:
+    """
+    Per language, the literal prefixes of all its patterns.
+    
+    None if any pattern lacks a prefix, since then no literal check can rule
+    a file out.
+    """
+    needles: Dict[str, Optional[Tuple[str, ...]]] = {}
+    for lang, kinds in table.items():
+        prefixes = [_literal_prefix(pattern) for patterns in kinds.values() for pattern in patterns]
+        if not all(prefixes):
+            needles[lang] = None
+            continue
+        unique = list(dict.fromkeys(prefixes))
+        # A needle containing a shorter one is redundant
+        needles[lang] = tuple(n for n in unique if not any(o != n and o in n for o in unique))
+    return needles
+
+
+# Literal substrings used to skip files that cannot contain a source or sink
+_SOURCE_NEEDLES = _needle_table(TaintTracker.TAINT_SOURCES)
+_SINK_NEEDLES = _needle_table(TaintTracker.TAINT_SINKS)
+
+
+def _may_contain_any(content: str, needles: Optional[Tuple[str, ...]]) -> bool:
+    """
+    Cheap check that content contains at least one needle.
+    
+    Patterns match case-insensitively, so content is lowercased first. That is
+    only equivalent to re.IGNORECASE for ASCII text; for anything else the
+    check is skipped and the regex scan decides.
+    """
+    if needles is None or not content.isascii():
+        return True
+    lowered = content.lower()
+    return any(needle in lowered for needle in needles)
+
+
+def _candidate_lines(content: str, any_pattern: re.Pattern) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (line_number, line) for lines that may match any_pattern.
+    
+    Searches the whole content instead of each line in turn, then jumps to
+    the next line after every hit. The patterns have no anchors, so a match
+    inside a line is also a match in the content and no line that matches on
+    its own is skipped. A hit that only matches across a newline yields a
+    line that the per-pattern checks then reject.
+    """
+    line_num = 1
+    line_start = 0
+    search = any_pattern.search
+    while True:
+        match = search(content, line_start)
+        if match is None:
+            return
+        match_start = match.start()
+        newlines = content.count('\n', line_start, match_start)
+        if newlines:
+            line_num += newlines
+            line_start = content.rfind('\n', line_start, match_start) + 1
+        line_end = content.find('\n', match_start)
+        if line_end == -1:
+            yield line_num, content[line_start:]
+            return
+        yield line_num, content[line_start:line_end]
+        line_num += 1
+        line_start = line_end + 1
+
+# Language-specific function call patterns. They run over whole files, so
+# whitespace before "(" excludes newlines to keep matches within one line.
+_FUNCTION_CALL_PATTERNS = {
+    'python': re.compile(r'(\w+)[^\S\n]*\('),
+    'javascript': re.compile(r'(\w+)[^\S\n]*\('),
+    'php': re.compile(r'(\w+)[^\S\n]*\('),
+    'java': re.compile(r'(\w+)[^\S\n]*\('),
+    'go': re.compile(r'(\w+)[^\S\n]*\('),
+}
+_NON_FUNCTION_WORDS = frozenset({'if', 'for', 'while', 'return', 'def', 'class', 'import'})
+
+
 class TaintAnalyzer:
     """Analyze taint flows across multiple files using AI."""
     
@@ -295,30 +484,48 @@ class TaintAnalyzer:
     
     def _find_all_sources_and_sinks(self):
         """Scan all files for sources and sinks."""
-        for file_path in self.files:
-            try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-                
-                # Find sources
-                sources = TaintTracker.find_sources_in_file(file_path, content)
-                self.sources.extend(sources)
-                
-                # Find sinks
-                sinks = TaintTracker.find_sinks_in_file(file_path, content)
-                self.sinks.extend(sinks)
-            
-            except Exception:
-                continue
+        if len(self.files) > 1:
+            # Overlap file reads; results come back in file order
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+                results = list(executor.map(_scan_file, self.files))
+        else:
+            results = [_scan_file(file_path) for file_path in self.files]
+        
+        for sources, sinks in results:
+            self.sources.extend(sources)
+            self.sinks.extend(sinks)
     
     def _build_potential_flows(self) -> List[TaintFlow]:
         """Build potential taint flows from sources to sinks."""
         flows = []
         
+        # Sources grouped by file, keeping their original order
+        sources_by_file: Dict[str, List[Tuple[int, TaintSource]]] = {}
+        for idx, source in enumerate(self.sources):
+            sources_by_file.setdefault(source.file, []).append((idx, source))
+        
+        # Relatedness only depends on the two file names, so it is decided once
+        # per (sink file, source file) pair rather than once per sink/source pair.
+        # Each entry lists (source, same_file) in source order.
+        candidates_by_sink_file: Dict[str, List[Tuple[TaintSource, bool]]] = {}
+        
         # For each sink, find related sources
         for sink in self.sinks:
-            for source in self.sources:
+            candidates = candidates_by_sink_file.get(sink.file)
+            if candidates is None:
+                matched = []
+                for source_file, entries in sources_by_file.items():
+                    if source_file == sink.file:
+                        matched.extend((idx, source, True) for idx, source in entries)
+                    elif self._files_likely_related(source_file, sink.file):
+                        matched.extend((idx, source, False) for idx, source in entries)
+                matched.sort(key=lambda entry: entry[0])
+                candidates = [(source, same_file) for _, source, same_file in matched]
+                candidates_by_sink_file[sink.file] = candidates
+            
+            for source, same_file in candidates:
                 # Same file - high confidence
-                if source.file == sink.file:
+                if same_file:
                     flow = TaintFlow(
                         source=source,
                         sink=sink,
@@ -330,7 +537,7 @@ class TaintAnalyzer:
                     flows.append(flow)
                 
                 # Different files - needs AI verification
-                elif self._files_likely_related(source.file, sink.file):
+                else:
                     flow = TaintFlow(
                         source=source,
                         sink=sink,
@@ -345,25 +552,58 @@ class TaintAnalyzer:
     
     def _files_likely_related(self, file1: str, file2: str) -> bool:
         """Check if two files are likely related (same module/directory)."""
-        path1 = Path(file1)
-        path2 = Path(file2)
-        
-        # Same directory
-        if path1.parent == path2.parent:
-            return True
-        
-        # Common naming (routes.py and user_routes.py)
-        if any(part in path2.name for part in path1.stem.split('_')):
-            return True
+        return _files_likely_related(file1, file2)
+
+
+@functools.lru_cache(maxsize=65536)
+def _files_likely_related(file1: str, file2: str) -> bool:
+    """
+    Cached implementation of TaintAnalyzer._files_likely_related.
+    
+    Not symmetric (the name and parent checks are directional), so the
+    arguments are not reordered for caching.
+    """
+    path1 = Path(file1)
+    path2 = Path(file2)
+    
+    # Same directory
+    if path1.parent == path2.parent:
+        return True
+    
+    # Common naming (routes.py and user_routes.py)
+    if any(part in path2.name for part in path1.stem.split('_')):
+        return True
+    
+    # Parent-child relationship (app/ and app/routes/)
+    try:
+        path2.relative_to(path1.parent)
+        return True
+    except ValueError:
+        pass
+    
+    return False
+
+
+# Threads for reading files during the source/sink scan
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _scan_file(file_path: Path) -> Tuple[List[TaintSource], List[TaintSink]]:
+    """Read one file and find its sources and sinks (empty on errors)."""
+    sources: List[TaintSource] = []
+    sinks: List[TaintSink] = []
+    try:
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
         
-        # Parent-child relationship (app/ and app/routes/)
-        try:
-            path2.relative_to(path1.parent)
-            return True
-        except ValueError:
-            pass
+        # Find sources
+        sources = TaintTracker.find_sources_in_file(file_path, content)
         
-        return False
+        # Find sinks
+        sinks = TaintTracker.find_sinks_in_file(file_path, content)
+    
+    except Exception:
+        pass
+    return sources, sinks
 
 
 def generate_taint_analysis_context(
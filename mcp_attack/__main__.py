@@ -15,7 +15,7 @@ import sys
 from datetime import datetime
 
 from mcp_attack import __version__
-from mcp_attack.cli import parse_args, build_url_list
+from mcp_attack.cli import parse_args, build_url_list, default_workers
 from mcp_attack.scanner import scan_target, run_parallel, detect_cross_shadowing
 from mcp_attack.reporting import print_report, write_json
 from mcp_attack.k8s import run_k8s_checks
@@ -34,6 +34,8 @@ console = Console()
 def main():
     args = parse_args()
     urls = build_url_list(args)
+    if args.workers is None:
+        args.workers = default_workers(len(urls))
 
     baseline = {}
     if args.baseline:
@@ -41,28 +43,30 @@ def main():
         if not baseline:
             console.print(f"[yellow]Baseline empty or not found: {args.baseline}[/yellow]")
 
-    panel_lines = [
-        f"[bold cyan]mcp-audit v{__version__}[/bold cyan]",
-        f"Targets : {len(urls)}",
-        f"Workers : {args.workers}",
-        f"Timeout : {args.timeout}s",
-        f"Verbose : {args.verbose}  Debug: {args.debug}",
-        f"Started : {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-    ]
-    if args.baseline:
-        panel_lines.append(f"Baseline: {args.baseline}")
-    if args.save_baseline:
-        panel_lines.append(f"Save baseline: {args.save_baseline}")
-    if args.auth_token:
-        panel_lines.append("Auth: Bearer token")
-
-    console.print(
-        Panel(
-            "\n".join(panel_lines),
-            title="MCP Security Scanner",
-            border_style="cyan",
+    # The banner is decoration only; skip it when quiet or not on a terminal
+    if console.is_terminal and not args.quiet:
+        panel_lines = [
+            f"[bold cyan]mcp-audit v{__version__}[/bold cyan]",
+            f"Targets : {len(urls)}",
+            f"Workers : {args.workers}",
+            f"Timeout : {args.timeout}s",
+            f"Verbose : {args.verbose}  Debug: {args.debug}",
+            f"Started : {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        ]
+        if args.baseline:
+            panel_lines.append(f"Baseline: {args.baseline}")
+        if args.save_baseline:
+            panel_lines.append(f"Save baseline: {args.save_baseline}")
+        if args.auth_token:
+            panel_lines.append("Auth: Bearer token")
+
+        console.print(
+            Panel(
+                "\n".join(panel_lines),
+                title="MCP Security Scanner",
+                border_style="cyan",
+            )
         )
-    )
 
     if not args.no_k8s:
         run_k8s_checks(args.k8s_namespace, console=console)
@@ -75,6 +79,7 @@ def main():
                 timeout=args.timeout,
                 verbose=args.verbose,
                 auth_token=args.auth_token,
+                rug_pull_delay=args.rug_pull_delay,
             )
         ]
     else:
@@ -84,6 +89,7 @@ def main():
             workers=args.workers,
             verbose=args.verbose,
             auth_token=args.auth_token,
+            rug_pull_delay=args.rug_pull_delay,
         )
 
     detect_cross_shadowing(results)
@@ -122,8 +128,11 @@ def main():
     if args.json_out:
         write_json(results, args.json_out, console=console)
 
-    all_findings = [f for r in results for f in r.findings]
-    if any(f.severity in ("CRITICAL", "HIGH") for f in all_findings):
+    if any(
+        f.severity in ("CRITICAL", "HIGH")
+        for r in results
+        for f in r.findings
+    ):
         sys.exit(1)
 
 
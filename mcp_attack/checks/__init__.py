@@ -72,13 +72,14 @@ def run_all_checks(
     base: str = "",
     sse_path: str = "",
     verbose: bool = False,
+    rug_pull_delay: float = 2.0,
 ):
     """Run all security checks against a target result."""
     check_tool_shadowing(all_results, result)
     check_prompt_injection(result)
     check_tool_poisoning(result)
     check_excessive_permissions(result)
-    check_rug_pull(session, result)
+    check_rug_pull(session, result, delay=rug_pull_delay)
     check_indirect_injection(session, result)
     check_token_theft(result)
     check_code_execution(result)
@@ -7,10 +7,11 @@ from mcp_attack.core.constants import MCP_INIT_PARAMS
 from mcp_attack.checks.base import time_check
 
 
-def check_rug_pull(session, result: TargetResult):
+def check_rug_pull(session, result: TargetResult, delay: float = 2.0):
     with time_check("rug_pull", result):
         first = session.call("tools/list", timeout=15)
-        time.sleep(2)
+        if delay > 0:
+            time.sleep(delay)
         second = session.call("tools/list", timeout=15)
 
         if not first or not second:
@@ -11,7 +11,7 @@ def check_tool_shadowing(
     all_results: list[TargetResult], result: TargetResult
 ):
     with time_check("tool_shadowing", result):
-        my_names = {t["name"].lower() for t in result.tools}
+        my_names = result.tool_names
 
         shadows = my_names & SHADOW_TARGETS
         if shadows:
@@ -24,7 +24,7 @@ def check_tool_shadowing(
         for other in all_results:
             if other.url == result.url:
                 continue
-            dupes = my_names & {t["name"].lower() for t in other.tools}
+            dupes = my_names & other.tool_names
             if dupes:
                 result.add(
                     "tool_shadowing",
@@ -35,7 +35,7 @@ def check_tool_shadowing(
 
 def check_multi_vector(result: TargetResult):
     with time_check("multi_vector", result):
-        checks_hit = {f.check for f in result.findings}
+        checks_hit = result.check_set
         dangerous = {
             "prompt_injection",
             "tool_poisoning",
@@ -66,7 +66,7 @@ def check_multi_vector(result: TargetResult):
 
 def check_attack_chains(result: TargetResult):
     with time_check("attack_chains", result):
-        checks = {f.check for f in result.findings}
+        checks = result.check_set
         for a, b in ATTACK_CHAIN_PATTERNS:
             if a in checks and b in checks:
                 result.add(
@@ -4,47 +4,34 @@ import re
 
 from mcp_attack.core.models import TargetResult
 from mcp_attack.checks.base import time_check
+from mcp_attack.patterns.matcher import PatternSet
 from mcp_attack.patterns.rules import CODE_EXEC_PATTERNS, RAC_PATTERNS
 
+_CODE_EXEC = PatternSet(CODE_EXEC_PATTERNS)
+_RAC = PatternSet(pattern for pattern, _ in RAC_PATTERNS.values())
+# Substrings of a lowercased param name that suggest it carries code
+_EXEC_PARAM_RE = re.compile(
+    "command|cmd|code|script|payload|exec|query|expression|statement"
+)
+
 
 def check_code_execution(result: TargetResult):
     with time_check("code_execution", result):
-        for tool in result.tools:
+        for tool, combined in zip(result.tools, result.tool_texts):
             name = tool.get("name", "")
-            combined = (
-                name
-                + " "
-                + tool.get("description", "")
-                + " "
-                + str(tool.get("inputSchema", {}))
-            )
 
-            for pat in CODE_EXEC_PATTERNS:
-                if re.search(pat, combined, re.IGNORECASE):
-                    result.add(
-                        "code_execution",
-                        "CRITICAL",
-                        f"Code execution indicator in tool '{name}'",
-                        f"Pattern: {pat}",
-                        evidence=combined[:300],
-                    )
-                    break
+            pat = _CODE_EXEC.first(combined)
+            if pat:
+                result.add(
+                    "code_execution",
+                    "CRITICAL",
+                    f"Code execution indicator in tool '{name}'",
+                    f"Pattern: {pat}",
+                    evidence=combined[:300],
+                )
 
             for pname in tool.get("inputSchema", {}).get("properties", {}):
-                if any(
-                    kw in pname.lower()
-                    for kw in [
-                        "command",
-                        "cmd",
-                        "code",
-                        "script",
-                        "payload",
-                        "exec",
-                        "query",
-                        "expression",
-                        "statement",
-                    ]
-                ):
+                if _EXEC_PARAM_RE.search(pname.lower()):
                     result.add(
                         "code_execution",
                         "HIGH",
@@ -57,8 +44,11 @@ def check_remote_access(result: TargetResult):
         for tool in result.tools:
             name = tool.get("name", "")
             combined = name + " " + tool.get("description", "")
+            matched = _RAC.all(combined)
+            if not matched:
+                continue
             for category, (pattern, severity) in RAC_PATTERNS.items():
-                if re.search(pattern, combined, re.IGNORECASE):
+                if pattern in matched:
                     result.add(
                         "remote_access",
                         severity,
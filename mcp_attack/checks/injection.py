@@ -4,26 +4,43 @@ import re
 
 from mcp_attack.core.models import TargetResult
 from mcp_attack.checks.base import time_check
+from mcp_attack.patterns.matcher import PatternSet
 from mcp_attack.patterns.rules import (
     INJECTION_PATTERNS,
     POISON_PATTERNS,
 )
 
+_INJECTION = PatternSet(INJECTION_PATTERNS)
+_POISON = PatternSet(POISON_PATTERNS, re.IGNORECASE | re.DOTALL)
+_INDIRECT = PatternSet(
+    INJECTION_PATTERNS + POISON_PATTERNS, re.IGNORECASE | re.DOTALL
+)
+# URLs pointing at common exfiltration / callback services
+_EXFIL_URL_RE = re.compile(
+    r"https?://[^\s'\"<>]*"
+    r"(?:webhook|ngrok|burp|requestbin|pipedream|canarytokens|interactsh)"
+    r"[^\s'\"<>]*"
+)
+# resources/read calls sent per JSON-RPC batch; larger batches only add
+# tail latency
+_READ_BATCH = 16
+# Zero-width characters (U+200B-U+200F) and the BOM
+_INVISIBLE_RE = re.compile("[\u200b-\u200f\ufeff]")
+
 
 def check_prompt_injection(result: TargetResult):
     with time_check("prompt_injection", result):
 
         def _scan(text: str, location: str):
-            for pat in INJECTION_PATTERNS:
-                if re.search(pat, text, re.IGNORECASE):
-                    result.add(
-                        "prompt_injection",
-                        "CRITICAL",
-                        "Prompt injection payload detected",
-                        f"Location: {location}",
-                        evidence=f"Pattern: {pat}\nText: {text[:300]}",
-                    )
-                    return
+            pat = _INJECTION.first(text)
+            if pat:
+                result.add(
+                    "prompt_injection",
+                    "CRITICAL",
+                    "Prompt injection payload detected",
+                    f"Location: {location}",
+                    evidence=f"Pattern: {pat}\nText: {text[:300]}",
+                )
 
         for tool in result.tools:
             name = tool.get("name", "")
@@ -54,51 +71,54 @@ def check_prompt_injection(result: TargetResult):
 
 def check_tool_poisoning(result: TargetResult):
     with time_check("tool_poisoning", result):
-        for tool in result.tools:
+        for tool, text in zip(result.tools, result.tool_texts):
             name = tool.get("name", "")
-            full = tool.get("description", "") + " " + str(
-                tool.get("inputSchema", {})
-            )
+            # Description and stringified schema: the shared tool text
+            # without its leading "name " part
+            full = text[len(name) + 1:]
 
-            for pat in POISON_PATTERNS:
-                if re.search(pat, full, re.IGNORECASE | re.DOTALL):
-                    result.add(
-                        "tool_poisoning",
-                        "CRITICAL",
-                        f"Tool poisoning indicator in '{name}'",
-                        f"Pattern: {pat}",
-                        evidence=full[:400],
-                    )
-                    break
+            pat = _POISON.first(full)
+            if pat:
+                result.add(
+                    "tool_poisoning",
+                    "CRITICAL",
+                    f"Tool poisoning indicator in '{name}'",
+                    f"Pattern: {pat}",
+                    evidence=full[:400],
+                )
 
-            for ch in tool.get("description", ""):
-                if ord(ch) in range(0x200B, 0x2010) or ord(ch) == 0xFEFF:
-                    result.add(
-                        "tool_poisoning",
-                        "CRITICAL",
-                        f"Invisible Unicode in tool '{name}'",
-                        "Possible hidden instructions via Unicode steganography",
-                        evidence=repr(tool["description"][:200]),
-                    )
-                    break
+            if _INVISIBLE_RE.search(tool.get("description", "")):
+                result.add(
+                    "tool_poisoning",
+                    "CRITICAL",
+                    f"Invisible Unicode in tool '{name}'",
+                    "Possible hidden instructions via Unicode steganography",
+                    evidence=repr(tool["description"][:200]),
+                )
 
 
 def check_indirect_injection(session, result: TargetResult):
     with time_check("indirect_injection", result):
-        for resource in result.resources:
-            uri = resource.get("uri", "")
+        uris = [resource.get("uri", "") for resource in result.resources]
+        for i in range(0, len(uris), _READ_BATCH):
+            chunk = uris[i:i + _READ_BATCH]
             try:
-                resp = session.call(
-                    "resources/read", {"uri": uri}, timeout=15
+                resps = session.call_batch(
+                    [("resources/read", {"uri": uri}) for uri in chunk],
+                    timeout=15,
                 )
-                if not resp or "result" not in resp:
-                    continue
-                for content in resp["result"].get("contents", []):
-                    text = content.get("text", "") or content.get("blob", "")
-                    if not text:
+            except Exception:
+                continue
+            for uri, resp in zip(chunk, resps):
+                try:
+                    if not resp or "result" not in resp:
                         continue
-                    for pat in INJECTION_PATTERNS + POISON_PATTERNS:
-                        if re.search(pat, text, re.IGNORECASE | re.DOTALL):
+                    for content in resp["result"].get("contents", []):
+                        text = content.get("text", "") or content.get("blob", "")
+                        if not text:
+                            continue
+                        pat = _INDIRECT.first(text)
+                        if pat:
                             result.add(
                                 "indirect_injection",
                                 "CRITICAL",
@@ -106,25 +126,12 @@ def check_indirect_injection(session, result: TargetResult):
                                 f"Pattern: {pat}",
                                 evidence=text[:400],
                             )
-                            break
-                    for u in re.findall(r"https?://[^\s'\"<>]+", text):
-                        if any(
-                            kw in u
-                            for kw in [
-                                "webhook",
-                                "ngrok",
-                                "burp",
-                                "requestbin",
-                                "pipedream",
-                                "canarytokens",
-                                "interactsh",
-                            ]
-                        ):
+                        for u in _EXFIL_URL_RE.findall(text):
                             result.add(
                                 "indirect_injection",
                                 "HIGH",
                                 f"Exfiltration URL in resource '{uri}'",
                                 evidence=u,
                             )
-            except Exception:
-                pass
+                except Exception:
+                    pass
@@ -1,11 +1,12 @@
 """Excessive permissions and schema risk checks."""
 
-import re
-
 from mcp_attack.core.models import TargetResult
 from mcp_attack.checks.base import time_check
+from mcp_attack.patterns.matcher import PatternSet
 from mcp_attack.patterns.rules import DANGEROUS_TOOL_PATTERNS
 
+_DANGEROUS = PatternSet(pattern for pattern, _ in DANGEROUS_TOOL_PATTERNS.values())
+
 
 def check_excessive_permissions(result: TargetResult):
     with time_check("excessive_permissions", result):
@@ -14,8 +15,9 @@ def check_excessive_permissions(result: TargetResult):
             desc = tool.get("description", "").lower()
             combined = f"{name} {desc}"
 
+            matched = _DANGEROUS.all(combined)
             for category, (pattern, severity) in DANGEROUS_TOOL_PATTERNS.items():
-                if re.search(pattern, combined, re.IGNORECASE):
+                if pattern in matched:
                     result.add(
                         "excessive_permissions",
                         severity,
@@ -1,32 +1,25 @@
 """Rate limiting and abuse resistance checks."""
 
-import re
-
 from mcp_attack.core.models import TargetResult
 from mcp_attack.checks.base import time_check
+from mcp_attack.patterns.matcher import PatternSet
 from mcp_attack.patterns.rules import RATE_LIMIT_PATTERNS
 
+_RATE_LIMIT = PatternSet(RATE_LIMIT_PATTERNS)
+
 
 def check_rate_limit(result: TargetResult):
     """Flag tools that suggest no rate limiting or unbounded invocations."""
     with time_check("rate_limit", result):
-        for tool in result.tools:
+        for tool, combined in zip(result.tools, result.tool_texts):
             name = tool.get("name", "")
-            combined = (
-                name
-                + " "
-                + tool.get("description", "")
-                + " "
-                + str(tool.get("inputSchema", {}))
-            )
 
-            for pat in RATE_LIMIT_PATTERNS:
-                if re.search(pat, combined, re.IGNORECASE):
-                    result.add(
-                        "rate_limit",
-                        "MEDIUM",
-                        f"Rate limit concern in tool '{name}'",
-                        f"Pattern suggests unbounded or unthrottled usage: {pat}",
-                        evidence=combined[:300],
-                    )
-                    break
+            pat = _RATE_LIMIT.first(combined)
+            if pat:
+                result.add(
+                    "rate_limit",
+                    "MEDIUM",
+                    f"Rate limit concern in tool '{name}'",
+                    f"Pattern suggests unbounded or unthrottled usage: {pat}",
+                    evidence=combined[:300],
+                )
@@ -4,44 +4,31 @@ import re
 
 from mcp_attack.core.models import TargetResult
 from mcp_attack.checks.base import time_check
+from mcp_attack.patterns.matcher import PatternSet
 from mcp_attack.patterns.rules import TOKEN_THEFT_PATTERNS
 
+_TOKEN_THEFT = PatternSet(TOKEN_THEFT_PATTERNS)
+# Substrings of a lowercased param name that suggest it carries a credential
+_CREDENTIAL_PARAM_RE = re.compile("token|secret|password|credential|key|auth")
+
 
 def check_token_theft(result: TargetResult):
     with time_check("token_theft", result):
-        for tool in result.tools:
+        for tool, combined in zip(result.tools, result.tool_texts):
             name = tool.get("name", "")
-            combined = (
-                name
-                + " "
-                + tool.get("description", "")
-                + " "
-                + str(tool.get("inputSchema", {}))
-            )
 
-            for pat in TOKEN_THEFT_PATTERNS:
-                if re.search(pat, combined, re.IGNORECASE):
-                    result.add(
-                        "token_theft",
-                        "CRITICAL",
-                        f"Token theft pattern in tool '{name}'",
-                        f"Pattern: {pat}",
-                        evidence=combined[:300],
-                    )
-                    break
+            pat = _TOKEN_THEFT.first(combined)
+            if pat:
+                result.add(
+                    "token_theft",
+                    "CRITICAL",
+                    f"Token theft pattern in tool '{name}'",
+                    f"Pattern: {pat}",
+                    evidence=combined[:300],
+                )
 
             for pname in tool.get("inputSchema", {}).get("properties", {}):
-                if any(
-                    kw in pname.lower()
-                    for kw in [
-                        "token",
-                        "secret",
-                        "password",
-                        "credential",
-                        "key",
-                        "auth",
-                    ]
-                ):
+                if _CREDENTIAL_PARAM_RE.search(pname.lower()):
                     result.add(
                         "token_theft",
                         "HIGH",
@@ -4,6 +4,7 @@ import httpx
 
 from mcp_attack.core.models import TargetResult
 from mcp_attack.core.constants import MCP_INIT_PARAMS
+from mcp_attack.core.session import shared_client
 from mcp_attack.checks.base import time_check
 
 
@@ -18,7 +19,7 @@ def _jrpc(method: str, params: dict | None = None, req_id: int = 1) -> dict:
 
 def check_sse_security(base: str, sse_path: str, result: TargetResult):
     with time_check("sse_security", result):
-        client = httpx.Client(verify=False, timeout=8)
+        client = shared_client()
         try:
             with client.stream(
                 "GET",
@@ -77,5 +78,3 @@ def check_sse_security(base: str, sse_path: str, result: TargetResult):
                 )
         except Exception:
             pass
-
-        client.close()
@@ -15,14 +15,28 @@ AUTH_TOKEN_ENV = "MCP_AUTH_TOKEN"
 PUBLIC_TARGETS_FILE = Path(__file__).parent / "data" / "public_targets.txt"
 
 
+_PORT_RANGE_RE = re.compile(r"^(.+):(\d+)-(\d+)$")
+
+
 def expand_port_range(spec: str) -> list[str]:
-    m = re.match(r"^(.+):(\d+)-(\d+)$", spec)
+    m = _PORT_RANGE_RE.match(spec)
     if not m:
         raise ValueError(f"Invalid port range spec: {spec!r}")
     host, start, end = m.group(1), int(m.group(2)), int(m.group(3))
     if end < start:
         raise ValueError(f"End port {end} < start port {start}")
-    return [f"http://{host}:{p}" for p in range(start, end + 1)]
+    prefix = f"http://{host}:"
+    return [prefix + str(p) for p in range(start, end + 1)]
+
+
+def default_workers(n_targets: int) -> int:
+    """
+    Worker count when --workers is not given.
+
+    Scans spend their time waiting on the network, so this follows
+    ThreadPoolExecutor's I/O-bound heuristic, capped by the target count.
+    """
+    return min(max(n_targets, 1), 32, (os.cpu_count() or 4) * 4)
 
 
 def parse_args(args: list[str] | None = None) -> argparse.Namespace:
@@ -68,15 +82,29 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     p.add_argument(
         "--workers",
         type=int,
-        default=4,
+        default=None,
         metavar="N",
-        help="Parallel scan workers (default: 4)",
+        help="Parallel scan workers (default: one per target, at most "
+        "min(32, 4 x CPUs))",
+    )
+    p.add_argument(
+        "--rug-pull-delay",
+        type=float,
+        default=2.0,
+        metavar="SEC",
+        help="Wait between the two tools/list calls of the rug pull check "
+        "(default: 2; 0 disables the wait)",
     )
     p.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Enable verbose output",
     )
+    p.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Skip the startup banner",
+    )
     p.add_argument(
         "--debug",
         action="store_true",
@@ -154,10 +182,5 @@ def build_url_list(args: argparse.Namespace) -> list[str]:
         )
         sys.exit(1)
 
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            deduped.append(u)
-    return deduped
+    # First occurrence wins; dicts keep insertion order
+    return list(dict.fromkeys(urls))
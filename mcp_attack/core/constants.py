@@ -8,6 +8,8 @@ MCP_INIT_PARAMS = {
 }
 
 SEVERITY_WEIGHTS = {"CRITICAL": 10, "HIGH": 7, "MEDIUM": 4, "LOW": 1}
+# Report sort order; unknown severities sort last
+SEVERITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
 
 SEV_COLOR = {
     "CRITICAL": "bold red",
@@ -17,8 +19,8 @@ SEV_COLOR = {
     "INFO": "dim",
 }
 
-SSE_PATHS = ["/sse", "/mcp/sse", "/v1/sse", "/stream", "/events", ""]
-POST_PATHS = ["/mcp", "/rpc", "/jsonrpc", "/v1/mcp", "/messages", ""]
+SSE_PATHS = ("/sse", "/mcp/sse", "/v1/sse", "/stream", "/events", "")
+POST_PATHS = ("/mcp", "/rpc", "/jsonrpc", "/v1/mcp", "/messages", "")
 
 ATTACK_CHAIN_PATTERNS = [
     ("prompt_injection", "code_execution"),
@@ -30,11 +32,12 @@ ATTACK_CHAIN_PATTERNS = [
     ("tool_poisoning", "token_theft"),
 ]
 
-SHADOW_TARGETS = {
+# Lowercase; compared against lowercased tool names
+SHADOW_TARGETS = frozenset({
     "ls", "cat", "echo", "read", "write", "open", "close", "get", "set",
     "list", "search", "find", "help", "info", "status", "ping", "run",
     "execute", "create", "delete", "update", "fetch", "send", "post",
     "memory_read", "memory_write", "file_read", "file_write",
     "web_search", "browser", "calculator", "send_email", "send_message",
     "think", "plan", "act", "observe", "reflect",
-}
+})
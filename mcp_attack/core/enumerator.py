@@ -38,18 +38,22 @@ def enumerate_server(session, result: TargetResult, verbose: bool = False):
     session.notify("notifications/initialized")
     time.sleep(0.5)
 
-    for attempt in range(3):
-        tr = session.call("tools/list", timeout=15, retries=2)
+    # The three lists are independent; request them together
+    tr, rr, pr = session.call_batch(
+        [("tools/list", None), ("resources/list", None), ("prompts/list", None)],
+        timeout=15,
+    )
+    for attempt in range(2):
         if tr and "result" in tr:
-            result.tools = tr["result"].get("tools", [])
             break
         time.sleep(1)
+        tr = session.call("tools/list", timeout=15, retries=2)
+    if tr and "result" in tr:
+        result.tools = tr["result"].get("tools", [])
 
-    rr = session.call("resources/list", timeout=15, retries=2)
     if rr and "result" in rr:
         result.resources = rr["result"].get("resources", [])
 
-    pr = session.call("prompts/list", timeout=15, retries=2)
     if pr and "result" in pr:
         result.prompts = pr["result"].get("prompts", [])
 
@@ -0,0 +1,35 @@
+"""JSON encoding for reports and baselines, using orjson when installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster report JSON, stdlib json used otherwise
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """
+    Encode obj as UTF-8 JSON with 2-space indentation.
+
+    Values orjson refuses (integers over 64 bits, non-string keys) fall
+    back to the stdlib encoder. With orjson, non-ASCII text is written as
+    UTF-8 rather than \\u escapes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON bytes; input orjson rejects (e.g. NaN) is retried with json."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
@@ -1,8 +1,9 @@
 """Data models for scan results."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 
-from mcp_attack.core.constants import SEV_COLOR
+from mcp_attack.core.constants import SEV_COLOR, SEVERITY_ORDER, SEVERITY_WEIGHTS
 
 
 @dataclass
@@ -13,6 +14,13 @@ class Finding:
     title: str
     detail: str = ""
     evidence: str = ""
+    # Derived from severity once, for report sorting and risk scores
+    sev_rank: int = field(init=False, repr=False, compare=False)
+    sev_weight: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.sev_rank = SEVERITY_ORDER.get(self.severity, 5)
+        self.sev_weight = SEVERITY_WEIGHTS.get(self.severity, 0)
 
 
 @dataclass
@@ -26,6 +34,22 @@ class TargetResult:
     findings: list[Finding] = field(default_factory=list)
     timings: dict[str, float] = field(default_factory=dict)
     error: str = ""
+    # (finding count, check names) behind check_set
+    _check_set_cache: tuple[int, frozenset[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (finding count, severity counts, risk score)
+    _severity_cache: tuple[int, Counter, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (tools list, tool count, texts) behind tool_texts
+    _tool_text_cache: tuple[list, int, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (tools list, tool count, names) behind tool_names
+    _tool_names_cache: tuple[list, int, frozenset[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add(
         self,
@@ -39,6 +63,60 @@ class TargetResult:
         self.findings.append(f)
         return f
 
+    @property
+    def check_set(self) -> frozenset[str]:
+        """Names of the checks that produced findings so far."""
+        cache = self._check_set_cache
+        if cache is None or cache[0] != len(self.findings):
+            cache = (len(self.findings), frozenset(f.check for f in self.findings))
+            self._check_set_cache = cache
+        return cache[1]
+
+    @property
+    def tool_texts(self) -> list[str]:
+        """
+        Name, description and stringified inputSchema of each tool, in
+        the order of tools. Built once and shared by the checks that scan
+        it; rebuilt when tools is replaced or grows. Do not modify.
+        """
+        cache = self._tool_text_cache
+        if cache is None or cache[0] is not self.tools or cache[1] != len(self.tools):
+            texts = [
+                t.get("name", "")
+                + " "
+                + t.get("description", "")
+                + " "
+                + str(t.get("inputSchema", {}))
+                for t in self.tools
+            ]
+            cache = (self.tools, len(self.tools), texts)
+            self._tool_text_cache = cache
+        return cache[2]
+
+    @property
+    def tool_names(self) -> frozenset[str]:
+        """Lowercased tool names, rebuilt when tools is replaced or grows."""
+        cache = self._tool_names_cache
+        if cache is None or cache[0] is not self.tools or cache[1] != len(self.tools):
+            names = frozenset(t["name"].lower() for t in self.tools)
+            cache = (self.tools, len(self.tools), names)
+            self._tool_names_cache = cache
+        return cache[2]
+
+    def _severity_stats(self) -> tuple[int, Counter, int]:
+        cache = self._severity_cache
+        if cache is None or cache[0] != len(self.findings):
+            cache = (
+                len(self.findings),
+                Counter(f.severity for f in self.findings),
+                sum(f.sev_weight for f in self.findings),
+            )
+            self._severity_cache = cache
+        return cache
+
+    def severity_counts(self) -> Counter:
+        """Findings per severity, in order of first appearance. Do not modify."""
+        return self._severity_stats()[1]
+
     def risk_score(self) -> int:
-        from mcp_attack.core.constants import SEVERITY_WEIGHTS
-        return sum(SEVERITY_WEIGHTS.get(f.severity, 0) for f in self.findings)
+        return self._severity_stats()[2]
@@ -1,13 +1,20 @@
 """MCP session handling: SSE and HTTP transport detection."""
 
+import atexit
 import json
 import queue
 import threading
 import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from urllib.parse import urljoin, urlparse
 
 import httpx
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster request encoding, stdlib json used otherwise
+
 from mcp_attack.core.constants import MCP_INIT_PARAMS, SSE_PATHS, POST_PATHS
 
 
@@ -20,6 +27,40 @@ def _jrpc(method: str, params: dict | None = None, req_id: int = 1) -> dict:
     }
 
 
+def _encode(payload: dict | list) -> bytes:
+    """Serialize a JSON-RPC request body; headers must set the content type."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+_shared_client: httpx.Client | None = None
+_shared_client_lock = threading.Lock()
+
+
+def shared_client() -> httpx.Client:
+    """
+    Process-wide pooled client for one-off probes and checks.
+
+    httpx.Client is thread-safe, so scan workers share one connection pool
+    and keep-alive connections to a host are reused across transport
+    detection and checks instead of a new client (and TCP/TLS handshake)
+    per call. Cookies are never stored, so one target's Set-Cookie cannot
+    leak into requests to another target on the same host.
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = httpx.Client(
+                    verify=False,
+                    timeout=8,
+                    cookies=CookieJar(DefaultCookiePolicy(allowed_domains=[])),
+                )
+                atexit.register(_shared_client.close)
+    return _shared_client
+
+
 def _auth_headers(auth_token: str | None) -> dict:
     """Build headers with optional Authorization Bearer."""
     h = {"Accept": "text/event-stream"}
@@ -146,7 +187,7 @@ class MCPSession:
             try:
                 r = self._client.post(
                     self.post_url,
-                    json=payload,
+                    content=_encode(payload),
                     headers=headers,
                     timeout=10,
                 )
@@ -179,6 +220,61 @@ class MCPSession:
                 time.sleep(1.0)
         return None
 
+    def call_batch(
+        self,
+        calls: list[tuple[str, dict | None]],
+        timeout: float | None = None,
+    ) -> list[dict | None]:
+        """
+        Pipeline several calls, returning responses in call order.
+
+        Every request is POSTed up front and the responses are then picked
+        off the SSE stream by id, so the calls share one wait instead of
+        one each. JSON-RPC batch arrays are not used: on this transport a
+        server that ignores them looks the same as a slow one. Calls with
+        no response in time are retried one by one.
+        """
+        wait = timeout or self.timeout
+        headers = _mcp_headers(self._auth_token)
+        ids: list[int | None] = []
+        for method, params in calls:
+            self._req_id += 1
+            try:
+                r = self._client.post(
+                    self.post_url,
+                    content=_encode(_jrpc(method, params, self._req_id)),
+                    headers=headers,
+                    timeout=10,
+                )
+                sent = r.status_code in (200, 202, 204)
+            except Exception:
+                sent = False
+            ids.append(self._req_id if sent else None)
+
+        waiting = {i for i in ids if i is not None}
+        responses: dict[int, dict] = {}
+        pending: list[dict] = []
+        deadline = time.time() + wait
+        while waiting and time.time() < deadline:
+            try:
+                msg = self._q.get(timeout=0.3)
+            except queue.Empty:
+                continue
+            rid = msg.get("id") if isinstance(msg, dict) else None
+            if isinstance(rid, int) and rid in waiting:
+                waiting.discard(rid)
+                responses[rid] = msg
+            else:
+                pending.append(msg)
+        for m in pending:
+            self._q.put(m)
+        # The pipelined request counts as the first of call()'s attempts
+        return [
+            responses[i] if i in responses
+            else self.call(m, p, timeout=timeout, retries=1)
+            for i, (m, p) in zip(ids, calls)
+        ]
+
     def notify(self, method: str, params: dict | None = None):
         payload = {
             "jsonrpc": "2.0",
@@ -188,7 +284,7 @@ class MCPSession:
         try:
             self._client.post(
                 self.post_url,
-                json=payload,
+                content=_encode(payload),
                 headers=_mcp_headers(self._auth_token),
                 timeout=5,
             )
@@ -227,6 +323,7 @@ class HTTPSession:
         self.post_url = post_url
         self.timeout = timeout
         self._req_id = 0
+        self._batch_ok = True
         self._stop = threading.Event()
         self._headers = headers or {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
         self._client = httpx.Client(
@@ -248,7 +345,7 @@ class HTTPSession:
             try:
                 r = self._client.post(
                     self.post_url,
-                    json=_jrpc(method, params, self._req_id),
+                    content=_encode(_jrpc(method, params, self._req_id)),
                     headers=self._headers,
                     timeout=timeout or self.timeout,
                 )
@@ -271,15 +368,74 @@ class HTTPSession:
                     time.sleep(0.5)
         return None
 
+    def call_batch(
+        self,
+        calls: list[tuple[str, dict | None]],
+        timeout: float | None = None,
+    ) -> list[dict | None]:
+        """
+        Send several calls as one JSON-RPC batch POST.
+
+        Responses are returned in call order. Calls the batch response has
+        no answer for are retried one by one; if the server rejects batches
+        altogether, batching is turned off for this session.
+        """
+        batched: list[dict | None] = [None] * len(calls)
+        if self._batch_ok and len(calls) > 1:
+            ids = []
+            payload = []
+            for method, params in calls:
+                self._req_id += 1
+                ids.append(self._req_id)
+                payload.append(_jrpc(method, params, self._req_id))
+            by_id = {
+                m["id"]: m
+                for m in self._post_batch(payload, timeout)
+                if isinstance(m, dict) and "id" in m
+            }
+            batched = [by_id.get(i) for i in ids]
+            if not any(batched):
+                self._batch_ok = False
+        return [
+            resp if resp is not None else self.call(m, p, timeout=timeout)
+            for resp, (m, p) in zip(batched, calls)
+        ]
+
+    def _post_batch(self, payload: list[dict], timeout: float | None) -> list:
+        """POST a batch and return the response messages (empty on failure)."""
+        try:
+            r = self._client.post(
+                self.post_url,
+                content=_encode(payload),
+                headers=self._headers,
+                timeout=timeout or self.timeout,
+            )
+            if r.status_code != 200:
+                return []
+            if "text/event-stream" not in r.headers.get("content-type", ""):
+                body = r.json()
+                return body if isinstance(body, list) else [body]
+            msgs: list = []
+            for line in r.text.splitlines():
+                if line.startswith("data:") and line[5:].strip():
+                    try:
+                        msg = json.loads(line[5:])
+                    except json.JSONDecodeError:
+                        continue
+                    msgs.extend(msg if isinstance(msg, list) else [msg])
+            return msgs
+        except Exception:
+            return []
+
     def notify(self, method: str, params: dict | None = None):
         try:
             self._client.post(
                 self.post_url,
-                json={
+                content=_encode({
                     "jsonrpc": "2.0",
                     "method": method,
                     "params": params or {},
-                },
+                }),
                 headers=self._headers,
                 timeout=5,
             )
@@ -305,7 +461,7 @@ def detect_transport(
 
     seen_paths: set[str] = set()
     ordered_paths: list[str] = []
-    for p in ([hint] if hint else []) + SSE_PATHS:
+    for p in ((hint,) if hint else ()) + SSE_PATHS:
         if p is not None and p not in seen_paths:
             seen_paths.add(p)
             ordered_paths.append(p)
@@ -321,11 +477,11 @@ def detect_transport(
 
         session.close()
 
-    client = httpx.Client(verify=False, timeout=8, follow_redirects=True)
+    client = shared_client()
 
     seen_post: set[str] = set()
     ordered_post: list[str] = []
-    for p in ([hint] if hint else []) + POST_PATHS:
+    for p in ((hint,) if hint else ()) + POST_PATHS:
         if p is not None and p not in seen_post:
             seen_post.add(p)
             ordered_post.append(p)
@@ -339,6 +495,7 @@ def detect_transport(
                 json=_jrpc("initialize", MCP_INIT_PARAMS),
                 headers=mcp_headers,
                 timeout=5,
+                follow_redirects=True,
             )
             is_jsonrpc_body = "jsonrpc" in r.text or "JSON-RPC" in r.text
             is_jsonrpc_error = r.status_code in (400, 422) and (
@@ -352,7 +509,6 @@ def detect_transport(
                 or (r.status_code == 200 and "text/event-stream" in r.headers.get("content-type", ""))
                 or is_jsonrpc_error
             ):
-                client.close()
                 return HTTPSession(base, post_url, timeout=connect_timeout, headers=mcp_headers)
         except Exception:
             pass
@@ -366,17 +522,16 @@ def detect_transport(
                     json=_jrpc("initialize", MCP_INIT_PARAMS),
                     headers=mcp_headers,
                     timeout=4,
+                    follow_redirects=True,
                 )
                 if r.status_code in (400, 404, 422):
                     session = MCPSession(
                         base, sse_path, timeout=connect_timeout, auth_token=auth_token
                     )
                     if session.wait_ready(timeout=10.0) and session.post_url:
-                        client.close()
                         return session
                     session.close()
             except Exception:
                 pass
 
-    client.close()
     return None
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
+from mcp_attack.core.jsonio import dumps_indented, loads
+
 
 @dataclass
 class DiffResult:
@@ -109,7 +111,7 @@ def load_baseline(path: str | Path) -> dict[str, dict]:
     p = Path(path)
     if not p.is_file():
         return {}
-    data = json.loads(p.read_text())
+    data = loads(p.read_bytes())
     # Format: { "targets": { url: { tools, resources, prompts } } }
     targets = data.get("targets", data)
     if isinstance(targets, dict):
@@ -141,7 +143,7 @@ def save_baseline(results: list, path: str | Path, console=None):
         "baseline": True,
         "targets": targets,
     }
-    p.write_text(json.dumps(report, indent=2))
+    p.write_bytes(dumps_indented(report))
     if console:
         console.print(f"\n[green]Baseline saved → {path}[/green]")
 
@@ -4,62 +4,78 @@ import base64
 import gzip
 import json
 import os
+import re
 from typing import Any
 
+import httpx
+
 from mcp_attack.core.models import Finding, TargetResult
 
 GLOBAL_K8S_FINDINGS: list[Finding] = []
 
+# Substrings of a lowercased Helm values key that suggest a credential
+_SECRET_KEY_RE = re.compile("password|secret|token|apikey")
 
-def _k8s_get(path: str, token: str) -> dict | None:
-    import ssl
-    import urllib.request
 
-    req = urllib.request.Request(
-        f"https://kubernetes.default{path}",
+def _k8s_client(token: str) -> httpx.Client:
+    """Client for the in-cluster API; one connection serves every request."""
+    return httpx.Client(
+        base_url="https://kubernetes.default",
         headers={"Authorization": f"Bearer {token}"},
+        verify=False,
+        timeout=10,
+        follow_redirects=True,
     )
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
+
+
+def _k8s_get(client: httpx.Client, path: str) -> dict | None:
     try:
-        with urllib.request.urlopen(req, timeout=10, context=ctx) as r:
-            return json.loads(r.read())
+        r = client.get(path)
+        if not r.is_success:
+            return None
+        return r.json()
     except Exception:
         return None
 
 
 def _scan_helm(sname: str, obj: Any, path: str):
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            np = f"{path}.{k}" if path else k
-            if isinstance(v, str):
-                if "PRIVATE KEY" in v:
-                    GLOBAL_K8S_FINDINGS.append(
-                        Finding(
-                            target="k8s",
-                            check="helm_secrets",
-                            severity="CRITICAL",
-                            title=f"Private key in Helm values: {sname} → {np}",
-                        )
+    # Walk with an explicit stack, children pushed in reverse so findings
+    # keep depth-first order; deeply nested values cannot hit the recursion
+    # limit. Entries are (value, parent path, dict key / list index / None).
+    stack: list[tuple[Any, str, Any]] = [(obj, path, None)]
+    while stack:
+        obj, parent, key = stack.pop()
+        if key is None:
+            path = parent
+        elif isinstance(key, int):
+            path = f"{parent}[{key}]"
+        else:
+            path = f"{parent}.{key}" if parent else key
+        if isinstance(obj, dict):
+            stack.extend((v, path, k) for k, v in reversed(obj.items()))
+        elif isinstance(obj, list):
+            stack.extend(
+                (obj[i], path, i) for i in range(len(obj) - 1, -1, -1)
+            )
+        elif isinstance(obj, str) and isinstance(key, str):
+            if "PRIVATE KEY" in obj:
+                GLOBAL_K8S_FINDINGS.append(
+                    Finding(
+                        target="k8s",
+                        check="helm_secrets",
+                        severity="CRITICAL",
+                        title=f"Private key in Helm values: {sname} → {path}",
                     )
-                elif any(
-                    s in k.lower()
-                    for s in ["password", "secret", "token", "apikey"]
-                ):
-                    GLOBAL_K8S_FINDINGS.append(
-                        Finding(
-                            target="k8s",
-                            check="helm_secrets",
-                            severity="HIGH",
-                            title=f"Credential in Helm values: {sname} → {np}",
-                        )
+                )
+            elif _SECRET_KEY_RE.search(key.lower()):
+                GLOBAL_K8S_FINDINGS.append(
+                    Finding(
+                        target="k8s",
+                        check="helm_secrets",
+                        severity="HIGH",
+                        title=f"Credential in Helm values: {sname} → {path}",
                     )
-            else:
-                _scan_helm(sname, v, np)
-    elif isinstance(obj, list):
-        for i, item in enumerate(obj):
-            _scan_helm(sname, item, f"{path}[{i}]")
+                )
 
 
 def run_k8s_checks(namespace: str, console=None):
@@ -76,12 +92,13 @@ def run_k8s_checks(namespace: str, console=None):
     if console:
         console.print(f"\n[bold]── K8s Internal Checks (ns={namespace}) ──[/bold]")
 
-    for name, path in [
-        ("secrets", f"/api/v1/namespaces/{namespace}/secrets"),
-        ("configmaps", f"/api/v1/namespaces/{namespace}/configmaps"),
-        ("pods", f"/api/v1/namespaces/{namespace}/pods"),
-    ]:
-        data = _k8s_get(path, token)
+    with _k8s_client(token) as client:
+        listings = {
+            name: _k8s_get(client, f"/api/v1/namespaces/{namespace}/{name}")
+            for name in ("secrets", "configmaps", "pods")
+        }
+
+    for name, data in listings.items():
         if data:
             count = len(data.get("items", []))
             sev = "HIGH" if name == "secrets" else "INFO"
@@ -94,9 +111,8 @@ def run_k8s_checks(namespace: str, console=None):
                 )
             )
 
-    secrets_data = _k8s_get(
-        f"/api/v1/namespaces/{namespace}/secrets", token
-    )
+    # Helm releases are stored as secrets; reuse the listing above
+    secrets_data = listings["secrets"]
     if secrets_data:
         for secret in secrets_data.get("items", []):
             if secret.get("type") != "helm.sh/release.v1":
@@ -11,6 +11,7 @@ from mcp_attack.patterns.rules import (
     PROMPT_LEAKAGE_PATTERNS,
     SUPPLY_CHAIN_PATTERNS,
 )
+from mcp_attack.patterns.matcher import PatternSet
 
 __all__ = [
     "INJECTION_PATTERNS",
@@ -22,4 +23,5 @@ __all__ = [
     "RATE_LIMIT_PATTERNS",
     "PROMPT_LEAKAGE_PATTERNS",
     "SUPPLY_CHAIN_PATTERNS",
+    "PatternSet",
 ]
@@ -0,0 +1,148 @@
+"""Compiled pattern sets shared by the security checks."""
+
+import re
+from typing import Iterable, Optional
+
+try:
+    import re2
+except ImportError:
+    re2 = None  # Optional: linear-time matching, stdlib re used otherwise
+
+# What Python's \s matches in str patterns; RE2's \s is ASCII-only and
+# leaves out \v
+_PY_SPACE = (
+    r"\t-\r\x1c-\x20\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}"
+    r"\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}"
+)
+_RE2_FLAGS = {re.IGNORECASE: "i", re.DOTALL: "s", re.MULTILINE: "m"}
+# Escapes whose meaning differs between re and RE2 (ASCII vs Unicode)
+_RE2_UNSAFE_ESCAPES = set("SdDwWbBN")
+# re's IGNORECASE also folds i to the Turkish dotted and dotless i
+_RE2_FOLD_I = "iI\u0130\u0131"
+
+
+def _to_re2(pattern: str, flags: int) -> Optional[str]:
+    r"""
+    Rewrite a Python regex so RE2 matches the same text, or return None.
+
+    \s is spelled out as Python's whitespace set, \uXXXX becomes \x{XXXX}
+    and, ignoring case, i also matches \u0130 and \u0131. Patterns using
+    flags, group syntax, escapes or a bare $ that RE2 would interpret
+    differently are left to the re module.
+    """
+    inline = ""
+    for flag, letter in _RE2_FLAGS.items():
+        if flags & flag:
+            inline += letter
+            flags &= ~flag
+    if flags & ~re.UNICODE:
+        return None
+    fold = "i" in inline
+    out = [f"(?{inline})" if inline else ""]
+    in_class = False
+    after_letter = False  # previous token was a literal letter
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if fold and c == "-" and in_class and after_letter:
+            # A letter range may span i
+            return None
+        after_letter = c.isalpha()
+        if c == "\\" and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            if nxt in _RE2_UNSAFE_ESCAPES:
+                return None
+            if nxt == "s":
+                out.append(_PY_SPACE if in_class else f"[{_PY_SPACE}]")
+            elif nxt == "u" and re.fullmatch(r"[0-9a-fA-F]{4}", pattern[i + 2:i + 6]):
+                out.append(f"\\x{{{pattern[i + 2:i + 6]}}}")
+                after_letter = chr(int(pattern[i + 2:i + 6], 16)).isalpha()
+                i += 4
+            elif nxt == "x" and re.fullmatch(r"[0-9a-fA-F]{2}", pattern[i + 2:i + 4]):
+                out.append(pattern[i:i + 4])
+                after_letter = chr(int(pattern[i + 2:i + 4], 16)).isalpha()
+                i += 2
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if c == "[" and not in_class:
+            in_class = True
+            out.append(c)
+            # A leading ] (after an optional ^) is a literal in both engines
+            if pattern[i + 1:i + 2] == "^":
+                out.append("^")
+                i += 1
+            if pattern[i + 1:i + 2] == "]":
+                out.append("]")
+                i += 1
+        elif c == "]" and in_class:
+            in_class = False
+            out.append(c)
+        elif c == "$" and not in_class and "m" not in inline:
+            # re's $ also matches before a trailing newline
+            return None
+        elif c == "(" and pattern[i + 1:i + 2] == "?":
+            # Only non-capturing groups and lookarounds
+            if not (
+                pattern[i + 2:i + 3] in (":", "=", "!")
+                or pattern[i + 2:i + 4] in ("<=", "<!")
+            ):
+                return None
+            out.append(c)
+        elif fold and c in "iI":
+            out.append(_RE2_FOLD_I if in_class else f"[{_RE2_FOLD_I}]")
+        else:
+            out.append(c)
+        i += 1
+    return "".join(out)
+
+
+def _compile(pattern: str, flags: int):
+    """Compile with RE2 when installed and equivalent, else with re."""
+    if re2 is not None:
+        translated = _to_re2(pattern, flags)
+        if translated is not None:
+            try:
+                return re2.compile(translated)
+            except re2.error:
+                pass
+    return re.compile(pattern, flags)
+
+
+class PatternSet:
+    """
+    A list of regex patterns compiled once.
+
+    All patterns are also joined into a single alternation, so text that
+    matches none of them (the common case) is rejected in one regex pass
+    instead of one search per pattern. Results are the same as searching
+    each pattern in list order.
+
+    If google-re2 is installed, patterns it can match identically are
+    compiled with it. RE2 runs in linear time, so descriptions crafted to
+    make the backtracking re module blow up (e.g. many "eval(" with no
+    URL after them) cannot stall a scan.
+    """
+
+    def __init__(self, patterns: Iterable[str], flags: int = re.IGNORECASE):
+        self.patterns = list(patterns)
+        self._compiled = [(p, _compile(p, flags)) for p in self.patterns]
+        self._any = _compile(
+            "|".join(f"(?:{p})" for p in self.patterns), flags
+        )
+
+    def first(self, text: str) -> Optional[str]:
+        """Return the first pattern (in list order) found in text, or None."""
+        if not self._any.search(text):
+            return None
+        for pat, rx in self._compiled:
+            if rx.search(text):
+                return pat
+        return None
+
+    def all(self, text: str) -> list[str]:
+        """Return every pattern found in text, in list order."""
+        if not self._any.search(text):
+            return []
+        return [pat for pat, rx in self._compiled if rx.search(text)]
@@ -1,6 +1,7 @@
 """Rich console reporting."""
 
 from collections import Counter
+from operator import attrgetter
 
 from rich.console import Console
 from rich.table import Table
@@ -23,10 +24,7 @@ def print_report(results: list[TargetResult]):
         console.print("[green]  No vulnerabilities found.[/green]")
         return
 
-    sev_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
-    sorted_f = sorted(
-        all_findings, key=lambda f: sev_order.get(f.severity, 5)
-    )
+    sorted_f = sorted(all_findings, key=attrgetter("sev_rank"))
 
     table = Table(box=box.ROUNDED, show_header=True, header_style="bold")
     table.add_column("Target", style="cyan", no_wrap=True)
@@ -75,7 +73,9 @@ def print_report(results: list[TargetResult]):
         )
     console.print(pt)
 
-    counts = Counter(f.severity for f in all_findings)
+    counts = Counter(f.severity for f in GLOBAL_K8S_FINDINGS)
+    for r in results:
+        counts.update(r.severity_counts())
     console.print(
         f"\n  [bold red]CRITICAL: {counts.get('CRITICAL', 0)}[/bold red]  |  "
         f"[red]HIGH: {counts.get('HIGH', 0)}[/red]  |  "
@@ -1,24 +1,23 @@
 """JSON report output."""
 
-import json
 from datetime import datetime, timezone
 from collections import Counter
 
+from mcp_attack.core.jsonio import dumps_indented
 from mcp_attack.core.models import TargetResult
 from mcp_attack.k8s.scanner import GLOBAL_K8S_FINDINGS
 
 
 def write_json(results: list[TargetResult], path: str, console=None):
+    severity_counts: Counter = Counter()
+    for r in results:
+        severity_counts.update(r.severity_counts())
     report = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "summary": {
             "targets": len(results),
             "total_findings": sum(len(r.findings) for r in results),
-            "severity_counts": dict(
-                Counter(
-                    f.severity for r in results for f in r.findings
-                )
-            ),
+            "severity_counts": dict(severity_counts),
         },
         "targets": [
             {
@@ -51,7 +50,7 @@ def write_json(results: list[TargetResult], path: str, console=None):
             for f in GLOBAL_K8S_FINDINGS
         ],
     }
-    with open(path, "w") as fh:
-        json.dump(report, fh, indent=2)
+    with open(path, "wb") as fh:
+        fh.write(dumps_indented(report))
     if console:
         console.print(f"\n[green]JSON report written → {path}[/green]")
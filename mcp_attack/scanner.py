@@ -27,13 +27,15 @@ console = Console()
 def detect_cross_shadowing(results: list[TargetResult]):
     """Detect tool name collisions across servers."""
     tool_map: dict[str, list[str]] = defaultdict(list)
+    results_by_url: dict[str, list[TargetResult]] = defaultdict(list)
     for r in results:
+        results_by_url[r.url].append(r)
         for t in r.tools:
             tool_map[t["name"]].append(r.url)
     for name, servers in tool_map.items():
         if len(servers) > 1:
-            for r in results:
-                if r.url in servers:
+            for url in dict.fromkeys(servers):
+                for r in results_by_url[url]:
                     r.add(
                         "cross_shadowing",
                         "MEDIUM",
@@ -48,6 +50,7 @@ def scan_target(
     timeout: float = 25.0,
     verbose: bool = False,
     auth_token: str | None = None,
+    rug_pull_delay: float = 2.0,
 ) -> TargetResult:
     result = TargetResult(url=url)
     t_start = time.time()
@@ -101,6 +104,7 @@ def scan_target(
         base=base,
         sse_path=sse_path,
         verbose=verbose,
+        rug_pull_delay=rug_pull_delay,
     )
 
     session.close()
@@ -118,6 +122,7 @@ def run_parallel(
     workers: int = 4,
     verbose: bool = False,
     auth_token: str | None = None,
+    rug_pull_delay: float = 2.0,
 ) -> list[TargetResult]:
     results: list[TargetResult] = []
     lock = threading.Lock()
@@ -141,7 +146,12 @@ def run_parallel(
             with lock:
                 snapshot = list(results)
             r = scan_target(
-                url, snapshot, timeout=timeout, verbose=verbose, auth_token=auth_token
+                url,
+                snapshot,
+                timeout=timeout,
+                verbose=verbose,
+                auth_token=auth_token,
+                rug_pull_delay=rug_pull_delay,
             )
             with lock:
                 results.append(r)
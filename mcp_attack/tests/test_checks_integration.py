@@ -6,6 +6,7 @@ from mcp_attack.core.models import TargetResult
 from mcp_attack.checks.rate_limit import check_rate_limit
 from mcp_attack.checks.prompt_leakage import check_prompt_leakage
 from mcp_attack.checks.supply_chain import check_supply_chain
+from mcp_attack.checks.chaining import check_attack_chains, check_multi_vector
 
 
 def test_new_checks_fire_on_dangerous_tool():
@@ -27,3 +28,43 @@ def test_new_checks_fire_on_dangerous_tool():
     assert "rate_limit" in checks_run
     assert "prompt_leakage" in checks_run
     assert "supply_chain" in checks_run
+
+
+def test_checks_see_replaced_tool_description():
+    """Shared tool text is rebuilt when the tools list is replaced."""
+    r = TargetResult(url="http://localhost:9001/sse")
+    r.tools = [{"name": "t", "description": "A safe tool", "inputSchema": {}}]
+    check_rate_limit(r)
+    assert not r.findings
+
+    r.tools = [
+        {"name": "t", "description": "Allows unlimited requests", "inputSchema": {}}
+    ]
+    check_rate_limit(r)
+    assert [f.check for f in r.findings] == ["rate_limit"]
+
+
+def test_attack_chains_see_multi_vector_findings():
+    """check_set picks up findings added after it was first read."""
+    r = TargetResult(url="http://localhost:9001/sse")
+    r.add("prompt_injection", "HIGH", "injection")
+    assert r.check_set == {"prompt_injection"}
+    r.add("code_execution", "HIGH", "exec")
+
+    check_multi_vector(r)
+    check_attack_chains(r)
+    assert "multi_vector" in r.check_set
+    assert [f.title for f in r.findings if f.check == "attack_chain"] == [
+        "Attack chain: prompt_injection → code_execution"
+    ]
+
+
+def test_risk_score_tracks_new_findings():
+    """Cached severity counts and risk score follow findings added later."""
+    r = TargetResult(url="http://localhost:9001/sse")
+    r.add("token_theft", "HIGH", "t")
+    assert r.risk_score() == 7
+    r.add("code_execution", "CRITICAL", "c")
+    r.add("code_execution", "INFO", "i")
+    assert r.risk_score() == 17
+    assert r.severity_counts() == {"HIGH": 1, "CRITICAL": 1, "INFO": 1}
@@ -8,6 +8,7 @@ import pytest
 from mcp_attack.cli import (
     parse_args,
     build_url_list,
+    default_workers,
     _load_urls_from_file,
     expand_port_range,
     PUBLIC_TARGETS_FILE,
@@ -119,3 +120,26 @@ def test_parse_args_baseline():
     args = parse_args(["--targets", "http://localhost:9001", "--save-baseline", "new_base.json"])
     assert args.save_baseline == "new_base.json"
     assert args.baseline is None
+
+
+def test_parse_args_rug_pull_delay():
+    """--rug-pull-delay defaults to 2 seconds and accepts overrides."""
+    args = parse_args(["--targets", "http://localhost:9001"])
+    assert args.rug_pull_delay == 2.0
+
+    args = parse_args(["--targets", "http://localhost:9001", "--rug-pull-delay", "0.5"])
+    assert args.rug_pull_delay == 0.5
+
+
+def test_parse_args_quiet():
+    """--quiet / -q is off by default."""
+    assert parse_args(["--targets", "http://localhost:9001"]).quiet is False
+    assert parse_args(["--targets", "http://localhost:9001", "-q"]).quiet is True
+
+
+def test_default_workers():
+    """Workers default to the target count, capped at 32."""
+    assert parse_args(["--targets", "http://localhost:9001"]).workers is None
+    assert default_workers(0) == 1
+    assert default_workers(1) == 1
+    assert 1 <= default_workers(1000) <= 32
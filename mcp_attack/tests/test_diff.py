@@ -156,3 +156,13 @@ def test_print_diff_report_no_crash():
     diff = DiffResult(url="http://localhost:9001")
     diff.added_tools = [{"name": "new_tool"}]
     print_diff_report([diff], "baseline.json", console=Console())
+
+
+def test_save_baseline_large_int_and_unicode(tmp_path):
+    """Values orjson cannot encode still round-trip through the baseline."""
+    r = TargetResult(url="http://localhost:9001/sse")
+    r.tools = [{"name": "t1", "description": "café", "inputSchema": {"maximum": 2**70}}]
+    path = tmp_path / "baseline.json"
+    save_baseline([r], path)
+    loaded = load_baseline(path)
+    assert loaded[r.url]["tools"] == r.tools
@@ -37,3 +37,43 @@ def test_supply_chain_user_provided():
     text = "Install from user-provided URL"
     matches = [p for p in SUPPLY_CHAIN_PATTERNS if re.search(p, text, re.IGNORECASE)]
     assert len(matches) >= 1
+
+
+def test_pattern_set_first_follows_list_order():
+    """PatternSet.first returns the earliest listed pattern, not the leftmost hit."""
+    from mcp_attack.patterns.matcher import PatternSet
+
+    ps = PatternSet([r"token", r"send"])
+    assert ps.first("send the TOKEN") == "token"
+    assert ps.first("nothing here") is None
+
+
+def test_pattern_set_all():
+    """PatternSet.all returns every matching pattern in list order."""
+    from mcp_attack.patterns.matcher import PatternSet
+
+    ps = PatternSet([r"ssh", r"vnc", r"rdp"])
+    assert ps.all("open a VNC or RDP session") == ["vnc", "rdp"]
+    assert ps.all("plain text") == []
+
+
+def test_to_re2_keeps_re_semantics():
+    """Patterns are rewritten for RE2 only where both engines agree."""
+    from mcp_attack.patterns.matcher import _to_re2
+
+    assert _to_re2(r"a\s+b", 0).startswith(r"a[\t-\r")
+    assert _to_re2(r"[\u200b-\u200f]", 0) == r"[\x{200b}-\x{200f}]"
+    assert _to_re2(r"jail", re.IGNORECASE) == "(?i)ja[iI\u0130\u0131]l"
+    assert _to_re2(r"\bword\b", 0) is None
+    assert _to_re2(r"end$", 0) is None
+    assert _to_re2(r"(?P<x>a)", 0) is None
+    assert _to_re2(r"[h-j]", re.IGNORECASE) is None
+
+
+def test_pattern_set_unicode_evasion():
+    """Unicode whitespace and dotless i still match, whichever engine is used."""
+    from mcp_attack.patterns.matcher import PatternSet
+
+    ps = PatternSet([r"ignore\s+(previous|prior|above|all)\s+instruction"])
+    assert ps.first("\u0131gnore all\u00a0instruct\u0131on") is not None
+    assert ps.first("ignore\vall instruction") is not None
@@ -0,0 +1,74 @@
+"""Tests for MCP session transports."""
+
+import json
+import queue
+
+import httpx
+
+from mcp_attack.core.session import HTTPSession, MCPSession
+
+
+def _session(handler) -> tuple[HTTPSession, list]:
+    """HTTPSession whose POSTs go to handler; returns it and the request bodies."""
+    bodies: list = []
+
+    def _record(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return handler(bodies[-1])
+
+    s = HTTPSession("http://mcp", "http://mcp/mcp")
+    s._client = httpx.Client(transport=httpx.MockTransport(_record))
+    return s, bodies
+
+
+def test_call_batch_one_post():
+    """A batch is sent as one POST and responses come back in call order."""
+
+    def handler(body):
+        return httpx.Response(
+            200,
+            json=[{"jsonrpc": "2.0", "id": c["id"], "result": c["params"]} for c in reversed(body)],
+        )
+
+    s, bodies = _session(handler)
+    resps = s.call_batch([("resources/read", {"uri": "a"}), ("resources/read", {"uri": "b"})])
+    assert len(bodies) == 1
+    assert [r["result"]["uri"] for r in resps] == ["a", "b"]
+
+
+def test_call_batch_falls_back_when_rejected():
+    """Servers without batch support get one call per request, and no more batches."""
+
+    def handler(body):
+        if isinstance(body, list):
+            return httpx.Response(400, json={"jsonrpc": "2.0", "id": None, "error": {}})
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": body["params"]})
+
+    s, bodies = _session(handler)
+    calls = [("resources/read", {"uri": "a"}), ("resources/read", {"uri": "b"})]
+    assert [r["result"]["uri"] for r in s.call_batch(calls)] == ["a", "b"]
+    assert [r["result"]["uri"] for r in s.call_batch(calls)] == ["a", "b"]
+    assert [isinstance(b, list) for b in bodies] == [True, False, False, False, False]
+
+
+def test_sse_call_batch_pipelines_and_retries_missing(monkeypatch):
+    """SSE calls are all posted before waiting; unanswered ones are retried singly."""
+    s = MCPSession.__new__(MCPSession)
+    s.post_url, s.timeout, s._auth_token, s._req_id = "http://mcp/messages", 0.3, None, 0
+    s._q = queue.Queue()
+    posted = []
+
+    class _Client:
+        def post(self, url, content, headers, timeout):
+            body = json.loads(content)
+            posted.append(body["method"])
+            if body["method"] != "prompts/list":
+                # Answer on the "stream" out of order: ahead of any earlier reply
+                s._q.queue.appendleft({"id": body["id"], "result": body["method"]})
+            return httpx.Response(202)
+
+    s._client = _Client()
+    monkeypatch.setattr(s, "call", lambda m, p, timeout=None, retries=2: {"result": "retried " + m})
+    resps = s.call_batch([("tools/list", None), ("resources/list", None), ("prompts/list", None)])
+    assert posted == ["tools/list", "resources/list", "prompts/list"]
+    assert [r["result"] for r in resps] == ["tools/list", "resources/list", "retried prompts/list"]
@@ -27,6 +27,7 @@ from rich.syntax import Syntax
 from lib.common import (
     parse_json_response,
     normalize_finding,
+    dump_findings,
     get_recommendation_text,
     get_line_number,
     handle_api_error,
@@ -702,7 +703,7 @@ class Orchestrator:
                 processed: List[Finding] = []
                 for item in original_findings:
                     if self._meets_severity_threshold(item.get("severity", "")):
-                        normalized = normalize_finding(item, file_path=fpath, source=f'claude-{src}')
+                        normalized = normalize_finding(item, file_path=fpath, source=f'claude-{src}', inplace=True)
                         processed.append(normalized)
                 return processed
             
@@ -1410,7 +1411,8 @@ class Orchestrator:
             generate_payloads=self.generate_payloads,
             annotate_code=self.annotate_code,
             top_n=self.top_n,
-            threat_model=self.threat_model
+            threat_model=self.threat_model,
+            parallel=self.parallel
         )
 
     def run(self) -> None:
@@ -1428,14 +1430,12 @@ class Orchestrator:
         for finding in static_findings:
             finding['source'] = 'agentsmith'
         static_output_file = self.output_path / "static_findings.json"
-        with open(static_output_file, "w", encoding="utf-8") as f:
-            json.dump(static_findings, f, indent=2)
+        dump_findings(static_findings, static_output_file)
         self.console.print(f"[dim]{len(static_findings)} static findings written to {static_output_file}[/dim]")
 
         ai_findings = self.run_ai_scanner(static_findings=static_findings)
         ai_output_file = self.output_path / "ai_findings.json"
-        with open(ai_output_file, "w", encoding="utf-8") as f:
-            json.dump(ai_findings, f, indent=2)
+        dump_findings(ai_findings, ai_output_file)
         self.console.print(f"[dim]{len(ai_findings)} AI findings written to {ai_output_file}[/dim]")
 
         self.console.print("\n[bold cyan]📊 Stage 3: Merging Results[/bold cyan]")
@@ -1487,8 +1487,7 @@ class Orchestrator:
         )
 
         combined_output_file = self.output_path / "combined_findings.json"
-        with open(combined_output_file, "w", encoding="utf-8") as f:
-            json.dump(combined, f, indent=2)
+        dump_findings(combined, combined_output_file)
         self.console.print(f"[green]✓[/green] {len(combined)} combined findings written to {combined_output_file}")
 
         csv_output_file = self.output_path / "combined_findings.csv"
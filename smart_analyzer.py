@@ -678,7 +678,7 @@ For more examples, run: python3 smart_analyzer.py --help-examples
         "--format",
         nargs="*",
         default=["console"],
-        choices=["console", "html", "markdown", "json"],
+        choices=["console", "html", "markdown", "json", "ndjson"],
     )
     # Model and generation controls
     p.add_argument("--model", default=CLAUDE_MODEL, help=model_cli_help())
@@ -1221,7 +1221,8 @@ def main() -> None:
     include_exts = set(args.include_exts or [])
 
     files = scan_repo_files(
-        repo_path, args.include_yaml, args.include_helm, args.max_file_bytes, args.max_files
+        repo_path, args.include_yaml, args.include_helm, args.max_file_bytes, args.max_files,
+        follow_symlinks=False,
     )
     # Apply include/ignore filters (post-filter to avoid changing core scanner semantics)
     if include_exts:
@@ -21,6 +21,7 @@ from lib.common import (
     CODE_EXTS,
     SKIP_DIRS,
     normalize_finding,
+    dump_findings,
     get_recommendation_text,
     get_line_number,
     handle_api_error,
@@ -61,6 +62,14 @@ class TestParseJsonResponse(unittest.TestCase):
         result = parse_json_response(invalid_json)
         self.assertIsNone(result)
     
+    def test_parse_json_with_trailing_object(self):
+        """Test that the first balanced object is used when trailing text has braces."""
+        text = 'Result: {"key": "a } brace", "nested": {"n": 1}} and later {"other": 2}'
+        result = parse_json_response(text)
+        self.assertIsNotNone(result)
+        self.assertEqual(result["key"], "a } brace")
+        self.assertEqual(result["nested"], {"n": 1})
+    
     def test_parse_empty_string(self):
         """Test parsing empty string returns None."""
         result = parse_json_response("")
@@ -79,6 +88,54 @@ class TestScanRepoFiles(unittest.TestCase):
         """Test that SKIP_DIRS contains expected directories."""
         expected = {".git", "node_modules", "__pycache__"}
         self.assertTrue(expected.issubset(SKIP_DIRS))
+    
+    def test_scan_prunes_skipped_dirs(self):
+        """Test that files under skipped directories are not returned."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "src" / "pkg").mkdir(parents=True)
+            (root / "node_modules" / "dep").mkdir(parents=True)
+            (root / "custom_skip").mkdir()
+            (root / "src" / "app.py").write_text("print('hi')\n")
+            (root / "src" / "pkg" / "util.go").write_text("package pkg\n")
+            (root / "src" / "notes.txt").write_text("not code\n")
+            (root / "node_modules" / "dep" / "index.js").write_text("x = 1\n")
+            (root / "custom_skip" / "gen.py").write_text("x = 1\n")
+            (root / "big.py").write_text("x" * 2000)
+            
+            files = scan_repo_files(root, max_file_bytes=1000, skip_dirs={"custom_skip"})
+            names = [f.name for f in files]
+            
+            self.assertEqual(names, ["util.go", "app.py"])
+            self.assertTrue(all(f.is_absolute() for f in files))
+    
+    def test_scan_respects_max_files(self):
+        """Test that max_files caps the number of results."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for i in range(5):
+                (root / f"f{i}.py").write_text("x = 1\n")
+            self.assertEqual(len(scan_repo_files(root, max_files=3)), 3)
+    
+    @unittest.skipIf(sys.version_info >= (3, 12), "rglob walks breadth-first from 3.12")
+    def test_scan_max_files_keeps_rglob_subset(self):
+        """Test that max_files keeps the first files rglob reaches."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for d in ("a", "b", "c"):
+                (root / d / "deep" / "deeper").mkdir(parents=True)
+                (root / d / f"{d}1.py").write_text("x = 1\n")
+                (root / d / "deep" / f"{d}2.py").write_text("x = 1\n")
+                (root / d / "deep" / "deeper" / f"{d}3.py").write_text("x = 1\n")
+            (root / "top.py").write_text("x = 1\n")
+            
+            reached = [p.resolve() for p in root.rglob("*") if p.suffix == ".py"]
+            for n in range(1, len(reached) + 1):
+                files = scan_repo_files(root, max_files=n)
+                self.assertEqual(sorted(files), sorted(reached[:n]), n)
 
 
 class TestRetryWithBackoff(unittest.TestCase):
@@ -113,6 +170,21 @@ class TestRetryWithBackoff(unittest.TestCase):
         self.assertEqual(call_count[0], 2)
 
 
+    def test_single_attempt_raises_immediately(self):
+        """Test that max_retries=1 calls once and propagates the error."""
+        call_count = [0]
+        
+        @retry_with_backoff(max_retries=1, base_delay=0.01)
+        def failing_func():
+            call_count[0] += 1
+            raise ValueError("boom")
+        
+        with self.assertRaises(ValueError):
+            failing_func()
+        self.assertEqual(call_count[0], 1)
+        self.assertEqual(failing_func.__name__, "failing_func")
+
+
 class TestNormalizeFinding(unittest.TestCase):
     """Test finding normalization utilities."""
     
@@ -237,6 +309,56 @@ class TestNormalizeFinding(unittest.TestCase):
         self.assertIn('line_number', normalized)
 
 
+    def test_normalize_inplace(self):
+        """Test that inplace=True normalizes and returns the same dict."""
+        original = {'severity': 'low', 'line': 10}
+        normalized = normalize_finding(original, inplace=True)
+        
+        self.assertIs(normalized, original)
+        self.assertEqual(original['severity'], 'LOW')
+        self.assertEqual(original['line_number'], 10)
+
+
+class TestDumpFindings(unittest.TestCase):
+    """Test findings serialization."""
+    
+    def test_dump_findings_roundtrip(self):
+        """Test that findings round-trip and Path values become strings."""
+        import tempfile
+        findings = [
+            {'file': Path('/test/vuln.py'), 'line': 3, 'title': 'SQL Injection ✓', 'severity': 'HIGH'},
+            {'file': '/test/other.py', 'line': 7, 'title': 'XSS', 'severity': 'LOW'},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "findings.json"
+            dump_findings(findings, out)
+            loaded = json.loads(out.read_text(encoding="utf-8"))
+        
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded[0]['file'], '/test/vuln.py')
+        self.assertEqual(loaded[0]['title'], 'SQL Injection ✓')
+        self.assertEqual(loaded[1], findings[1])
+    
+    def test_dump_findings_backends_match(self):
+        """Test that the orjson and json backends write identical files."""
+        import tempfile
+        from unittest.mock import patch
+        import lib.common
+        if lib.common.orjson is None:
+            self.skipTest("orjson not installed")
+        findings = [
+            {'file': Path('/test/vuln.py'), 'title': 'SQL Injection ✓', 'lines': {3: 'a', 7: 'b'}},
+            {'title': 'XSS', 'tags': [], 'meta': {}},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            fast = Path(tmp) / "orjson.json"
+            slow = Path(tmp) / "json.json"
+            dump_findings(findings, fast)
+            with patch.object(lib.common, "orjson", None):
+                dump_findings(findings, slow)
+            self.assertEqual(fast.read_bytes(), slow.read_bytes())
+
+
 class TestGetRecommendationText(unittest.TestCase):
     """Test recommendation text extraction."""
     
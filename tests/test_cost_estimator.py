@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test suite for scan cost estimation.
+
+Tests token and cost estimates in lib/cost_estimator.py.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.cost_estimator import (
+    estimate_file_tokens,
+    estimate_scan_cost,
+    TOKENS_PER_LINE,
+    PROMPT_OVERHEAD,
+    AVG_OUTPUT_TOKENS,
+)
+
+
+class TestEstimateFileTokens(unittest.TestCase):
+    """Test per-file token estimation."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_counts_lines(self):
+        """Test that tokens scale with line count, including a trailing partial line."""
+        path = self.root / "a.py"
+        path.write_text("a = 1\nb = 2\nc = 3\n")
+        self.assertEqual(estimate_file_tokens(path), int(3 * TOKENS_PER_LINE))
+        
+        path = self.root / "b.py"
+        path.write_text("a = 1\nb = 2")
+        self.assertEqual(estimate_file_tokens(path), int(2 * TOKENS_PER_LINE))
+    
+    def test_empty_file(self):
+        """Test that an empty file has no tokens."""
+        path = self.root / "empty.py"
+        path.write_text("")
+        self.assertEqual(estimate_file_tokens(path), 0)
+    
+    def test_large_file_counts_match(self):
+        """Test that memory-mapped counting of large files matches line counts."""
+        path = self.root / "large.py"
+        line = "x = 'abcdefghijklmnopqrstuvwxyz'\n"
+        count = (3 << 20) // len(line)
+        path.write_text(line * count + "tail")
+        self.assertEqual(estimate_file_tokens(path), int((count + 1) * TOKENS_PER_LINE))
+    
+    def test_counts_cr_and_crlf_lines(self):
+        """Test that \\r and \\r\\n line endings count as they do for readlines()."""
+        cases = {
+            "cr.py": b"a = 1\rb = 2\rc = 3\r",
+            "crlf.py": b"a = 1\r\nb = 2\r\nc = 3",
+            "mixed.py": b"a = 1\r\n\rb = 2\n\r",
+            # Large enough to be memory-mapped, with a \r\n straddling the
+            # first chunk boundary
+            "large.py": b"x" * ((1 << 20) - 1) + b"\r\n" + b"y = 2\r" * (1 << 18),
+        }
+        for name, data in cases.items():
+            path = self.root / name
+            path.write_bytes(data)
+            with open(path, "r", encoding="utf-8") as f:
+                expected = len(f.readlines())
+            self.assertEqual(estimate_file_tokens(path), int(expected * TOKENS_PER_LINE), name)
+    
+    def test_missing_file(self):
+        """Test the default estimate for unreadable files."""
+        self.assertEqual(estimate_file_tokens(self.root / "missing.py"), 1000)
+    
+    def test_modified_file_is_recounted(self):
+        """Test that cached estimates are invalidated when a file changes."""
+        path = self.root / "c.py"
+        path.write_text("x = 1\n")
+        first = estimate_file_tokens(path)
+        
+        path.write_text("x = 1\n" * 10)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertGreater(estimate_file_tokens(path), first)
+
+
+class TestEstimateScanCost(unittest.TestCase):
+    """Test whole-scan cost estimation."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.files = []
+        for i in range(4):
+            path = self.root / f"f{i}.py"
+            path.write_text("line\n" * (i + 1) * 10)
+            self.files.append(path)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_analysis_breakdown(self):
+        """Test per-profile analysis totals."""
+        result = estimate_scan_cost(self.files, "claude-haiku-4-5", ["owasp", "attacker"])
+        file_tokens = sum(estimate_file_tokens(f) for f in self.files)
+        per_profile = PROMPT_OVERHEAD["analysis"] * len(self.files) + file_tokens
+        
+        self.assertEqual(result["breakdown_by_stage"]["analysis_owasp"]["input_tokens"], per_profile)
+        self.assertEqual(result["breakdown_by_stage"]["analysis"]["input_tokens"], per_profile * 2)
+        self.assertEqual(result["breakdown_by_stage"]["analysis"]["calls"], len(self.files) * 2)
+        self.assertEqual(
+            result["breakdown_by_stage"]["analysis"]["output_tokens"],
+            AVG_OUTPUT_TOKENS["analysis"] * len(self.files) * 2,
+        )
+    
+    def test_parallel_matches_serial(self):
+        """Test that process-pool estimation gives the same totals."""
+        files = []
+        for i in range(70):
+            path = self.root / f"p{i}.py"
+            path.write_text("line\n" * (i + 1))
+            files.append(path)
+        
+        serial = estimate_scan_cost(files, "claude-haiku-4-5", ["owasp"], threat_model=True)
+        parallel = estimate_scan_cost(files, "claude-haiku-4-5", ["owasp"], threat_model=True, parallel=True)
+        self.assertEqual(serial["total_input_tokens"], parallel["total_input_tokens"])
+        self.assertEqual(serial["breakdown_by_stage"], parallel["breakdown_by_stage"])
+    
+    def test_optional_stages(self):
+        """Test that enabled stages are included in the totals."""
+        result = estimate_scan_cost(
+            self.files,
+            "claude-haiku-4-5",
+            ["owasp"],
+            prioritize=True,
+            prioritize_top=2,
+            generate_payloads=True,
+            annotate_code=True,
+            top_n=3,
+            threat_model=True,
+        )
+        breakdown = result["breakdown_by_stage"]
+        for stage in ("prioritization", "payload_generation", "annotation", "threat_modeling"):
+            self.assertIn(stage, breakdown)
+        
+        self.assertEqual(breakdown["analysis"]["files"], 2)
+        threat_input = PROMPT_OVERHEAD["threat_modeling"] + sum(estimate_file_tokens(f) for f in self.files)
+        self.assertEqual(breakdown["threat_modeling"]["input_tokens"], threat_input)
+        self.assertEqual(result["total_calls"], 1 + 2 + 3 + 3 + 1)
+        self.assertAlmostEqual(
+            result["total_estimated_cost"],
+            sum(v["cost"] for k, v in breakdown.items() if not k.startswith("analysis_")),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test suite for finding deduplication.
+
+Tests similarity checks and merge strategies in lib/deduplication.py.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.deduplication import are_findings_similar, deduplicate_findings
+
+
+def _finding(title, line=10, file="app/views.py", severity="MEDIUM", source="", **extra):
+    finding = {"file": file, "line_number": line, "title": title, "severity": severity}
+    if source:
+        finding["source"] = source
+    finding.update(extra)
+    return finding
+
+
+class TestAreFindingsSimilar(unittest.TestCase):
+    """Test pairwise similarity."""
+
+    def test_exact_title_same_line(self):
+        """Test that identical titles on the same line are similar."""
+        self.assertTrue(are_findings_similar(_finding("SQL Injection"), _finding("sql injection ")))
+
+    def test_different_files(self):
+        """Test that findings in different files are never similar."""
+        self.assertFalse(are_findings_similar(
+            _finding("SQL Injection"), _finding("SQL Injection", file="app/models.py")
+        ))
+
+    def test_line_window(self):
+        """Test the +/-5 line window."""
+        self.assertTrue(are_findings_similar(_finding("XSS", line=10), _finding("XSS", line=15)))
+        self.assertFalse(are_findings_similar(_finding("XSS", line=10), _finding("XSS", line=16)))
+
+    def test_unparseable_lines_require_exact_match(self):
+        """Test that non-numeric line values must match exactly."""
+        self.assertTrue(are_findings_similar(_finding("XSS", line="10-12"), _finding("XSS", line="10-12")))
+        self.assertFalse(are_findings_similar(_finding("XSS", line="10-12"), _finding("XSS", line="10-13")))
+
+    def test_fuzzy_title(self):
+        """Test fuzzy title matching against the threshold."""
+        a = _finding("SQL Injection in login query")
+        b = _finding("SQL Injection in login queries")
+        self.assertTrue(are_findings_similar(a, b))
+        self.assertFalse(are_findings_similar(_finding("Hardcoded secret"), _finding("Open redirect")))
+
+    def test_security_terms_with_category(self):
+        """Test matching via shared security terms and similar categories."""
+        a = _finding("Command execution via os.system", category="A03 Injection")
+        b = _finding("Unsafe shell command execution path", category="A03 - Injection")
+        self.assertTrue(are_findings_similar(a, b))
+        b["category"] = "Cryptographic Failures"
+        self.assertFalse(are_findings_similar(a, b))
+
+    def test_missing_title(self):
+        """Test that findings without titles are never similar."""
+        self.assertFalse(are_findings_similar(_finding(""), _finding("")))
+
+    def test_rule_name_fallback(self):
+        """Test that rule_name is used when title is absent."""
+        a = {"file": "x.py", "line": 3, "rule_name": "Weak Hash"}
+        b = {"file": "x.py", "line": 4, "rule_name": "weak hash"}
+        self.assertTrue(are_findings_similar(a, b))
+
+
+class TestDeduplicateFindings(unittest.TestCase):
+    """Test whole-list deduplication."""
+
+    def test_empty(self):
+        """Test that an empty list stays empty."""
+        self.assertEqual(deduplicate_findings([]), [])
+
+    def test_keep_highest_severity(self):
+        """Test that the highest-severity duplicate is kept with combined sources in report order."""
+        findings = [
+            _finding("SQL Injection", severity="MEDIUM", source="claude-owasp"),
+            _finding("Unrelated issue", line=200),
+            _finding("SQL injection", line=12, severity="CRITICAL", source="claude-attacker"),
+        ]
+        result = deduplicate_findings(findings)
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]["severity"], "CRITICAL")
+        self.assertEqual(result[0]["source"], "claude-owasp, claude-attacker")
+        self.assertEqual(result[0]["profiles"], ["claude-owasp", "claude-attacker"])
+        self.assertEqual(result[1]["title"], "Unrelated issue")
+        # Input dicts are not modified
+        self.assertNotIn("profiles", findings[2])
+
+    def test_keep_first(self):
+        """Test that keep_first keeps the first duplicate untouched."""
+        findings = [_finding("XSS", severity="LOW"), _finding("xss", line=11, severity="HIGH")]
+        result = deduplicate_findings(findings, merge_strategy="keep_first")
+        self.assertEqual(result, [findings[0]])
+
+    def test_merge(self):
+        """Test that merge combines sources, severity and recommendations."""
+        findings = [
+            _finding("XSS", severity="LOW", source="claude-owasp", recommendation="Escape output"),
+            _finding("XSS", line=11, severity="high", source="claude-attacker", fix="Use a template engine"),
+            _finding("XSS", line=12, source="claude-owasp", recommendation="N/A"),
+        ]
+        result = deduplicate_findings(findings, merge_strategy="merge")
+
+        self.assertEqual(len(result), 1)
+        merged = result[0]
+        self.assertEqual(merged["severity"], "high")
+        self.assertEqual(merged["source"], "claude-owasp, claude-attacker")
+        self.assertEqual(merged["profiles"], ["claude-owasp", "claude-attacker", "claude-owasp"])
+        self.assertEqual(merged["recommendation"], "Escape output | Use a template engine")
+        self.assertEqual(merged["line_number"], 10)
+
+    def test_distinct_lines_not_merged(self):
+        """Test that same-title findings far apart in a file are kept separate."""
+        findings = [_finding("XSS", line=line) for line in (10, 40, 70)]
+        self.assertEqual(len(deduplicate_findings(findings)), 3)
+
+    def test_transitive_grouping(self):
+        """Test that duplicates chained through a middle finding form one group."""
+        findings = [_finding("XSS", line=10), _finding("XSS", line=18), _finding("XSS", line=14)]
+        result = deduplicate_findings(findings, merge_strategy="keep_first")
+        self.assertEqual(result, [findings[0]])
+
+    def test_output_order_follows_input(self):
+        """Test that surviving findings keep input order."""
+        findings = [
+            _finding("B issue", file="b.py"),
+            _finding("A issue", file="a.py"),
+            _finding("B issue", file="b.py", line=11),
+            _finding("C issue", file="c.py"),
+        ]
+        result = deduplicate_findings(findings, merge_strategy="keep_first")
+        self.assertEqual([f["file"] for f in result], ["b.py", "a.py", "c.py"])
+
+    def test_many_findings(self):
+        """Test dedup over a larger list spread across files and lines."""
+        findings = []
+        for file_idx in range(20):
+            for line in range(0, 500, 25):
+                findings.append(_finding("Path traversal", file=f"f{file_idx}.py", line=line))
+                findings.append(_finding("path traversal", file=f"f{file_idx}.py", line=line + 2))
+        result = deduplicate_findings(findings)
+        self.assertEqual(len(result), len(findings) // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -214,6 +214,15 @@ class TestMalformedInputs(unittest.TestCase):
         result = parse_json_response(nested_malformed)
         self.assertTrue(result is None or isinstance(result, dict))
     
+    def test_pathological_braces(self):
+        """Test that unbalanced brace-heavy input fails fast instead of backtracking."""
+        import time
+        pathological = "{" + '{"a": ' * 50_000 + "} trailing }"
+        started = time.monotonic()
+        result = parse_json_response(pathological)
+        self.assertIsNone(result)
+        self.assertLess(time.monotonic() - started, 5.0)
+    
     def test_json_with_unicode_errors(self):
         """Test JSON with problematic unicode."""
         unicode_json = '{"title": "Test \\u0000 null byte"}'
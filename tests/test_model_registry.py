@@ -116,6 +116,12 @@ class TestModelDef(unittest.TestCase):
             self.assertGreater(model.context_window, 0)
             self.assertIsInstance(model.description, str)
 
+    def test_aliases_are_lowercase(self):
+        """Test that IDs and aliases are lowercase (they are lookup keys as-is)."""
+        for model in ALL_MODELS:
+            for name in (model.model_id,) + model.aliases:
+                self.assertEqual(name, name.lower())
+
     def test_current_models_not_deprecated(self):
         """Test that current models are not marked deprecated."""
         for model in CURRENT_MODELS:
@@ -179,6 +185,22 @@ class TestDefaultModel(unittest.TestCase):
             model = get_default_model()
             self.assertEqual(model, DEFAULT_MODEL_ID)
 
+    def test_get_default_model_follows_env_changes(self):
+        """Test that changing CLAUDE_MODEL between calls is picked up."""
+        with patch.dict(os.environ, {"CLAUDE_MODEL": "opus"}):
+            self.assertEqual(get_default_model(), "claude-opus-4-6")
+        with patch.dict(os.environ, {"CLAUDE_MODEL": "haiku"}):
+            self.assertEqual(get_default_model(), "claude-haiku-4-5-20251001")
+        with patch.dict(os.environ, {"CLAUDE_MODEL": "opus"}):
+            self.assertEqual(get_default_model(), "claude-opus-4-6")
+
+    def test_get_default_model_warns_on_every_invalid_call(self):
+        """Test that the fallback warning is not swallowed by caching."""
+        with patch.dict(os.environ, {"CLAUDE_MODEL": "totally-fake-model"}):
+            for _ in range(2):
+                with self.assertLogs("lib.model_registry", level="WARNING"):
+                    self.assertEqual(get_default_model(), DEFAULT_MODEL_ID)
+
 
 class TestPricing(unittest.TestCase):
     """Test model pricing lookups."""
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for report export in lib/output_manager.py.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rich.console import Console
+
+from lib.models import AnalysisReport, Finding
+from lib.output_manager import OutputManager
+
+
+def _report(count, question="Any code injection?", separator="\n"):
+    findings = [
+        Finding(
+            file_path=f"src/module_{i}.py",
+            finding=f'Unsafe "eval" call{separator}in handler {i}',
+            recommendation="Use ast.literal_eval",
+            relevance="HIGH",
+            impact="CRITICAL" if i % 2 else "LOW",
+            confidence="MEDIUM",
+            effort="LOW",
+            cwe="CWE-95",
+            line_number=i if i % 2 else None,
+        )
+        for i in range(count)
+    ]
+    return AnalysisReport(
+        repo_path="/tmp/repo",
+        question=question,
+        timestamp="2024-01-01T00:00:00",
+        file_count=count,
+        insights=findings,
+        synthesis="Summary\nwith two lines",
+    )
+
+
+def _expected_json(report):
+    return json.dumps({
+        "repo_path": report.repo_path,
+        "question": report.question,
+        "timestamp": report.timestamp,
+        "file_count": report.file_count,
+        "synthesis": report.synthesis,
+        "findings": [
+            {
+                "file_path": f.file_path,
+                "finding": f.finding,
+                "recommendation": f.recommendation,
+                "impact": f.impact,
+                "relevance": f.relevance,
+                "line_number": f.line_number,
+            }
+            for f in report.insights
+        ],
+    }, indent=2)
+
+
+class TestSaveReports(unittest.TestCase):
+    """Test report files written by save_reports."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name) / "out" / "report"
+        self.manager = OutputManager(Console(file=open("/dev/null", "w")))
+
+    def tearDown(self):
+        self.manager.console.file.close()
+        self.tmp.cleanup()
+
+    def test_json_matches_full_dump(self):
+        """Test that streamed JSON is identical to dumping the whole report."""
+        for count in (0, 1, 5):
+            report = _report(count)
+            self.manager.save_reports(report, ["json"], self.base)
+            text = self.base.with_suffix(".json").read_text(encoding="utf-8")
+            self.assertEqual(text, _expected_json(report))
+
+    def test_ndjson_one_finding_per_line(self):
+        """Test that NDJSON lines parse to the JSON report's findings."""
+        report = _report(3)
+        self.manager.save_reports(report, ["ndjson"], self.base)
+        text = self.base.with_suffix(".ndjson").read_text(encoding="utf-8")
+        self.assertTrue(text.endswith("\n"))
+        records = [json.loads(line) for line in text.splitlines()]
+        self.assertEqual(records, json.loads(_expected_json(report))["findings"])
+
+    def test_markdown_rows(self):
+        """Test that Markdown has the header table and one row per finding."""
+        self.manager.save_reports(_report(3, separator=" "), ["markdown"], self.base)
+        lines = self.base.with_suffix(".md").read_text(encoding="utf-8").split("\n")
+        self.assertEqual(lines[0], "# Analysis Report")
+        self.assertEqual(lines[-4], "|--------|------|---------|----------------|")
+        self.assertEqual(lines[-3], "| LOW | module_0.py | Unsafe \"eval\" call in handler 0 | Use ast.literal_eval |")
+        self.assertEqual(lines[-1], "| LOW | module_2.py | Unsafe \"eval\" call in handler 2 | Use ast.literal_eval |")
+
+    def test_html_escapes_report_text(self):
+        """Test that HTML output escapes finding and report text."""
+        report = _report(2, question="<script>alert(1)</script>")
+        self.manager.save_reports(report, ["html"], self.base)
+        text = self.base.with_suffix(".html").read_text(encoding="utf-8")
+        self.assertNotIn("<script>", text)
+        self.assertIn("&lt;script&gt;", text)
+        self.assertIn("Unsafe &quot;eval&quot; call", text)
+        self.assertEqual(text.count("<tr><td>"), 2)
+        self.assertTrue(text.endswith("</table></body></html>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,6 +55,11 @@ class TestPromptComposer(unittest.TestCase):
         self.assertTrue(has_composed_support(["owasp", "springboot"]))
         self.assertTrue(has_composed_support(["compliance"]))
 
+    def test_has_composed_support_attacker_only(self):
+        """has_composed_support is False when only the attacker profile is active."""
+        self.assertFalse(has_composed_support(["attacker"]))
+        self.assertFalse(has_composed_support([]))
+
     def test_composed_format_works(self):
         """Composed prompt can be formatted with standard placeholders."""
         composed = compose_prompt(["owasp"], use_legacy_fallback=True)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for taint source/sink detection in lib/taint_tracker.py.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.taint_tracker import TaintAnalyzer, TaintFlow, TaintSink, TaintSource, TaintTracker
+
+
+class TestFindSources(unittest.TestCase):
+    """Test source detection."""
+
+    def test_python_sources(self):
+        """Test that sources are found with their line, type and variable."""
+        content = "import os\nname = request.args.get('n')\n\nc = request.cookies['s']\n"
+        sources = TaintTracker.find_sources_in_file(Path("app/views.py"), content)
+        self.assertEqual(
+            [(s.line, s.source_type, s.variable) for s in sources],
+            [(2, "http_param", "name"), (4, "cookie", "c")],
+        )
+
+    def test_unknown_language(self):
+        """Test that unsupported files yield no sources."""
+        self.assertEqual(TaintTracker.find_sources_in_file(Path("notes.txt"), "request.args"), [])
+
+
+class TestFindSinks(unittest.TestCase):
+    """Test sink detection."""
+
+    def test_one_sink_per_type_per_line(self):
+        """Test that each sink type reports its first matching pattern once per line."""
+        content = "eval(cursor.execute(q))\nx = 1\nos.system(cmd)"
+        sinks = TaintTracker.find_sinks_in_file(Path("db.py"), content)
+        self.assertEqual(
+            [(s.line, s.sink_type, s.function) for s in sinks],
+            [(1, "sql", "execute("), (1, "command", "eval("), (3, "command", "os.system(")],
+        )
+
+    def test_match_split_across_lines_is_ignored(self):
+        """Test that a pattern only matching across a newline is not reported."""
+        content = "result = os.system\n(cmd)\nsafe = 1"
+        self.assertEqual(TaintTracker.find_sinks_in_file(Path("run.py"), content), [])
+
+    def test_case_insensitive(self):
+        """Test that sink patterns ignore case."""
+        sinks = TaintTracker.find_sinks_in_file(Path("q.php"), "$r = MYSQLI_QUERY($c, $q);")
+        self.assertEqual([(s.line, s.sink_type) for s in sinks], [(1, "sql")])
+
+    def test_non_ascii_content(self):
+        """Test that sinks are still found in files with non-ASCII text."""
+        sinks = TaintTracker.find_sinks_in_file(Path("util.py"), "# café\nEVAL(x)")
+        self.assertEqual([(s.line, s.function) for s in sinks], [(2, "EVAL(")])
+
+    def test_file_without_sink_keywords(self):
+        """Test that a file with none of the sink keywords has no sinks."""
+        self.assertEqual(TaintTracker.find_sinks_in_file(Path("util.py"), "x = 1\ny = x + 2\n"), [])
+
+    def test_last_line_without_newline(self):
+        """Test that a sink on a final unterminated line is found."""
+        sinks = TaintTracker.find_sinks_in_file(Path("main.go"), "package main\n\ndb.Exec(q)")
+        self.assertEqual([(s.line, s.function) for s in sinks], [(3, "db.Exec(")])
+
+
+class TestFindFunctionCalls(unittest.TestCase):
+    """Test function call extraction."""
+
+    def test_calls_skip_keywords(self):
+        """Test that control-flow keywords are not reported as calls."""
+        calls = TaintTracker.find_function_calls("if (x):\n    run(load(y))", "python")
+        self.assertEqual(calls, [("run", 2), ("load", 2)])
+
+
+class TestPotentialFlows(unittest.TestCase):
+    """Test source-to-sink flow candidates."""
+
+    def test_flows_by_file_relationship(self):
+        """Test same-file, related-file and unrelated-file pairs, in sink then source order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "app").mkdir()
+            (root / "other").mkdir()
+            files = {
+                "app/views.py": "q = request.args.get('q')\ncursor.execute(q)",
+                "app/forms.py": "f = request.form",
+                "other/tasks.py": "t = request.args",
+            }
+            for rel, content in files.items():
+                (root / rel).write_text(content)
+            paths = [root / rel for rel in files]
+
+            flows = TaintAnalyzer(root, paths).analyze()
+
+        self.assertEqual(
+            [(Path(f.source.file).name, Path(f.sink.file).name, f.confidence) for f in flows],
+            [("views.py", "views.py", 0.8), ("forms.py", "views.py", 0.6)],
+        )
+
+
+class TestTaintFlow(unittest.TestCase):
+    """Test TaintFlow properties."""
+
+    def test_file_count(self):
+        """Test that file_count counts distinct source, sink and hop files."""
+        source = TaintSource(file="a.py", line=1, variable="q", source_type="http_param")
+        flow = TaintFlow(source, TaintSink("a.py", 2, "eval(", "command"), [], [], 5, 0.8)
+        self.assertEqual(flow.file_count, 1)
+        flow.sink = TaintSink("b.py", 2, "eval(", "command")
+        self.assertEqual(flow.file_count, 2)
+        flow.hops.extend([("c.py", 3, "passes q"), ("a.py", 4, "returns q")])
+        self.assertEqual(flow.file_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()